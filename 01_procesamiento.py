@@ -1,16 +1,31 @@
 import pandas as pd
 import numpy as np
 
-import os
 import re
 from datetime import datetime
 import locale
 
 from os import getcwd
 from os import listdir
+from glob import glob
 from sys import exit
 import datetime
 import calendar
+import xlsxwriter
+
+# Lector multihilo de pyarrow si está instalado; si no, el parser C de pandas
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Lector de Excel en Rust (calamine, pandas>=2.2) si está instalado; si no, el de pandas por defecto
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None
 
 
 # -------------------------------------------------------------- #
@@ -136,155 +151,211 @@ sensores = {
 
 }
 
-# Función para clasificar cada variable
-def clasificar_variable(variable):
-    for sensor, tipos in sensores.items():
-        for tipo, lista_variables in tipos.items():
-            if variable in lista_variables:
-                return sensor, tipo
-    return None, None  # Si no se encuentra en ningún diccionario
-
-# Función para calculo de los datos esperados
-def calcular_esperado(frecuencia):
-    return {
-        'minuto': 6*24*nro_dias,
-        'horario': 24*nro_dias,
-        # 'horario*2': 2*24*nro_dias,
-        'diario': nro_dias,
-        # 'diario*2': 2*nro_dias
-    }.get(frecuencia, np.nan)
+# Índice plano {variable: (sensor, tipo)} generado una sola vez al importar
+VAR_INDEX = {}
+for sensor, tipos in sensores.items():
+    for tipo, lista_variables in tipos.items():
+        for variable in lista_variables:
+            VAR_INDEX[variable] = (sensor, tipo)
+
+# Clasificación de cada variable: (sensor, tipo), o None si no se encuentra en ningún diccionario
+clasificar_variable = VAR_INDEX.get
+# Proyección {variable: sensor} para usar directamente con Series.map
+SENSOR_POR_VARIABLE = {variable: sensor for variable, (sensor, _) in VAR_INDEX.items()}
+
+# Categorías de disponibilidad indexadas por código (ver clasificar_disponibilidad)
+CATEGORIAS_DISPONIBILIDAD = np.array([
+    'No recibido en el período',            # 0: NaN o 0
+    'Más del 100%',                         # 1: > 100
+    'Normal (≥ 80%)',                       # 2: [80, 100]
+    'Problemas de disponibilidad (≥ 30%)',  # 3: [30, 80)
+    'Problemas de disponibilidad (< 30%)'   # 4: resto
+], dtype=object)
 
 # Función para clasificar la estación en base a su disponibilidad
 def clasificar_disponibilidad(disponibilidad):
     """
-    Clasifica una estación según su porcentaje de disponibilidad.
+    Clasifica cada fila según su porcentaje de disponibilidad.
 
     Parámetros:
-    - disponibilidad: float o None, porcentaje de disponibilidad (0 a 100+)
+    - disponibilidad: Series de float, porcentaje de disponibilidad (0 a 100+, NaN si falta)
 
     Retorna:
-    - str, categoría de disponibilidad
+    - ndarray de str, categoría de disponibilidad por fila
     """
-    if disponibilidad is None or disponibilidad == 0:
-        return 'No recibido en el período'
-    elif disponibilidad > 100:
-        return 'Más del 100%'
-    elif disponibilidad >= 80:
-        return 'Normal (≥ 80%)'
-    elif disponibilidad >= 30:
-        return 'Problemas de disponibilidad (≥ 30%)'
-    else:
-        return 'Problemas de disponibilidad (< 30%)'
+    d = disponibilidad.to_numpy(dtype=np.float64, na_value=np.nan)
+    # Códigos int8 asignados de menor a mayor prioridad; solo al final se traducen a texto
+    codigos = np.full(d.shape, 4, dtype=np.int8)
+    codigos[d >= 30] = 3
+    codigos[d >= 80] = 2
+    codigos[d > 100] = 1
+    codigos[np.isnan(d) | (d == 0)] = 0
+    return CATEGORIAS_DISPONIBILIDAD[codigos]
+
+# Función para escribir un DataFrame en una hoja nueva, fila por fila
+def escribir_hoja(workbook, nombre_hoja, df, formato_encabezado=None):
+    """
+    Escribe el encabezado y las filas de un DataFrame en una hoja de xlsxwriter.
+
+    Parámetros:
+    - workbook: xlsxwriter.Workbook (admite constant_memory)
+    - nombre_hoja: str, nombre de la hoja a crear
+    - df: DataFrame a escribir (sin índice)
+    - formato_encabezado: formato opcional para la fila de encabezado
+    """
+    ws = workbook.add_worksheet(nombre_hoja)
+    ws.write_row(0, 0, df.columns.tolist(), formato_encabezado)
+    # object + None: categóricas como sus valores y NaN como celda vacía
+    valores = df.astype(object).where(df.notna(), None)
+    for fila, registro in enumerate(valores.itertuples(index=False, name=None), start=1):
+        ws.write_row(fila, 0, registro)
     
 # -------------------------------------------------------------- #
 # ------------------- PROCESAMIENTO INICIAL -------------------- #
 # -------------------------------------------------------------- #
-archivos = os.listdir()
-archivos_disponibilidad = [
-    archivo for archivo in archivos 
-    if archivo.startswith('disponibilidad_') and archivo.endswith('.csv')
-]
-
-# Apertura del archivo de disponibilidad
-reporte_sgr = pd.read_csv(archivos_disponibilidad[0])
+archivos_disponibilidad = sorted(glob('disponibilidad_*.csv'))
+
+# Apertura del archivo de disponibilidad (solo las columnas objetivo)
+reporte_sgr = pd.read_csv(
+    archivos_disponibilidad[0],
+    engine=CSV_ENGINE,
+    usecols=['DZ', 'Estacion', 'Variable', 'Datos_flag_C', 'Datos_flag_M', 'Datos_flag_SD'],
+    # Conteos con tipo explícito: el lector no tiene que inferirlo columna por columna
+    dtype={'Datos_flag_C': 'int32', 'Datos_flag_M': 'int32', 'Datos_flag_SD': 'int32'}
+)
 # Quitamos los parametros operacionales
 parametros_operacionales = ["N_BATERIA", "N_TEMP_INT_TRANS"]
-reporte_sgr = reporte_sgr[~reporte_sgr["Variable"].isin(parametros_operacionales)]
-# Escogemos las columnas objetivo
-reporte_sgr = reporte_sgr[['DZ', 'Estacion', 'Variable', 'Datos_flag_C', 'Datos_flag_M', 'Datos_flag_SD']]
+mask_operacionales = np.isin(reporte_sgr["Variable"].to_numpy(), parametros_operacionales)
+reporte_sgr = reporte_sgr.loc[~mask_operacionales]
 # Apertura del archivo de frecuencias correctas
-var_frecuencia = pd.read_excel('variables_frecuencia.xlsx', sheet_name='frecuencias')
+var_frecuencia = pd.read_excel(
+    'variables_frecuencia.xlsx', sheet_name='frecuencias', engine=EXCEL_ENGINE,
+    usecols=['DZ', 'Estacion', 'Variable', 'Frecuencia']
+)
+
+# Claves de unión como categóricas con las mismas categorías (ordenadas) en ambos lados,
+# de modo que el merge compare códigos enteros en lugar de strings
+tipos_clave = {
+    col: pd.CategoricalDtype(np.sort(pd.concat([reporte_sgr[col], var_frecuencia[col]]).dropna().unique()))
+    for col in ['DZ', 'Estacion', 'Variable']
+}
+reporte_sgr = reporte_sgr.astype(tipos_clave)
+var_frecuencia = var_frecuencia.astype(tipos_clave)
 
 # Unir df1 con df2 usando merge, en las columnas comunes
 reporte_correcto = reporte_sgr.merge(
-    var_frecuencia[['DZ', 'Estacion', 'Variable', 'Frecuencia']],
+    var_frecuencia,
     on=['DZ', 'Estacion', 'Variable'],
     how='left'
 )
 
 # Seteo del número de días a analizar
 nro_dias = 7
+# Datos esperados por frecuencia de medición para el período
+ESPERADO = {
+    'minuto': 6*24*nro_dias,
+    'horario': 24*nro_dias,
+    # 'horario*2': 2*24*nro_dias,
+    'diario': nro_dias,
+    # 'diario*2': 2*nro_dias
+}
 
 # Calculo de los datos esperados en base a la frecuencia de medición
-reporte_correcto['Datos_esperados'] = reporte_correcto['Frecuencia'].apply(lambda f: calcular_esperado(f))
+# (frecuencias no contempladas quedan como NaN)
+reporte_correcto['Datos_esperados'] = reporte_correcto['Frecuencia'].map(ESPERADO)
 # Se quita una unidad ya que se contabiliza un dato más debido a que la selección inicia con una dato
 # (00 horas) que no corresponde al periodo seleccionado, debe de comenzar en la hora 1 del día y no 0
-reporte_correcto['Datos_flag_C'] = reporte_correcto['Datos_flag_C'].apply(
-    lambda x: x - 1 if x > 1 else x
-)
+datos_c = reporte_correcto['Datos_flag_C'].to_numpy()
+reporte_correcto['Datos_flag_C'] = np.where(datos_c > 1, datos_c - 1, datos_c)
 
 # -------------------------------------------------------------- #
 # DISPONIBILIDAD POR VARIABLE
 # Calculo de la disponibilidad de datos por variable
-disponibilidad_variable = reporte_correcto.copy()
-disponibilidad_variable['disponibilidad'] = round((disponibilidad_variable['Datos_flag_C'] / disponibilidad_variable['Datos_esperados']) * 100, 2)
-disponibilidad_variable["var_disp"] = disponibilidad_variable["disponibilidad"].apply(clasificar_disponibilidad)
-disponibilidad_variable = disponibilidad_variable[['DZ', 'Estacion', 'Variable', 'Frecuencia', 'Datos_flag_C', 
-                                                   'Datos_flag_M', 'Datos_flag_SD', 'Datos_esperados', 'disponibilidad', 'var_disp']]
-disponibilidad_variable[['Sensor', 'Tipo']] = disponibilidad_variable['Variable'].apply(
-    lambda v: pd.Series(clasificar_variable(v))
+# reporte_correcto no se vuelve a usar: se trabaja sobre el mismo frame sin copiarlo
+disponibilidad_variable = reporte_correcto
+datos_c = disponibilidad_variable['Datos_flag_C'].to_numpy(dtype=np.float64, na_value=np.nan)
+datos_esp = disponibilidad_variable['Datos_esperados'].to_numpy(dtype=np.float64, na_value=np.nan)
+disponibilidad_variable['disponibilidad'] = np.round(datos_c / datos_esp * 100.0, 2)
+disponibilidad_variable["var_disp"] = clasificar_disponibilidad(disponibilidad_variable["disponibilidad"])
+# Sensor como categórica con categorías ordenadas (el 'Tipo' no se usa en los reportes)
+disponibilidad_variable['Sensor'] = pd.Categorical(
+    disponibilidad_variable['Variable'].map(SENSOR_POR_VARIABLE),
+    categories=sorted(sensores)
 )
-disponibilidad_variable.drop('Tipo', axis=1, inplace=True)
-disponibilidad_variable.sort_values(by = ["DZ", "Estacion", "Sensor", "Variable"], ascending=True, inplace=True)
+# Una sola proyección seguida del ordenamiento; las 4 claves son categóricas ordenadas,
+# así el ordenamiento (estable) compara códigos enteros y no strings
 disponibilidad_variable = disponibilidad_variable[['DZ', 'Estacion', 'Sensor', 'Variable', 'Frecuencia', 'Datos_flag_C',
                                                    'Datos_flag_M', 'Datos_flag_SD', 'Datos_esperados', 'disponibilidad', 'var_disp']]
+disponibilidad_variable = disponibilidad_variable.sort_values(
+    by=["DZ", "Estacion", "Sensor", "Variable"], ascending=True, kind='mergesort', ignore_index=True
+)
 
 # -------------------------------------------------------------- #
 # DISPONIBILIDAD POR EQUIPAMIENTO
-# Aplicar la función a la columna 'Variable'
-disp_variable = disponibilidad_variable[['DZ', 'Estacion', 'Variable', 'disponibilidad']].copy()
-disp_variable[['Sensor', 'Tipo']] = disp_variable['Variable'].apply(
-    lambda v: pd.Series(clasificar_variable(v))
-)
+# Se reutiliza la columna 'Sensor' ya clasificada en la disponibilidad por variable
+# Las claves de agrupación ya son categóricas (códigos enteros) y vienen ordenadas del sort previo
+# Suma y conteo por equipamiento en una sola pasada sobre la hoja por variable (sin copiarla).
+# La media por estación se obtiene de estos parciales, así sigue ponderada por número de variables como antes.
+# dropna=False conserva las variables sin sensor asignado, que sí cuentan para la estación.
+parciales = disponibilidad_variable.groupby(
+    ["DZ", "Estacion", "Sensor"], sort=False, observed=True, dropna=False
+)['disponibilidad'].agg(['sum', 'count']).reset_index()
+
 # Calculo de la disponibilidad por equipamiento
-disponibilidad_equipamiento = disp_variable.groupby(["DZ", "Estacion", "Sensor"]).agg({
-    'disponibilidad': 'mean'
-}).reset_index()
-disponibilidad_equipamiento["var_disp"] = disponibilidad_equipamiento["disponibilidad"].apply(clasificar_disponibilidad)
+con_sensor = parciales['Sensor'].notna()
+disponibilidad_equipamiento = (
+    parciales.loc[con_sensor, ['DZ', 'Estacion', 'Sensor']]
+    .assign(disponibilidad=parciales['sum'] / parciales['count'])
+    .reset_index(drop=True)
+)
+disponibilidad_equipamiento["var_disp"] = clasificar_disponibilidad(disponibilidad_equipamiento["disponibilidad"])
 
 # -------------------------------------------------------------- #
 # DISPONIBILIDAD POR ESTACION
-# Calculo de la disponibilidad por estación
-disponibilidad_estacion = disp_variable.groupby(["DZ", "Estacion"]).agg({
-    'disponibilidad': lambda x: round(x.mean(), 2)
-}).reset_index()
-disponibilidad_estacion["var_disp"] = disponibilidad_estacion["disponibilidad"].apply(clasificar_disponibilidad)
+# Calculo de la disponibilidad por estación a partir de los parciales por equipamiento
+totales = parciales.groupby(["DZ", "Estacion"], sort=False, observed=True)[['sum', 'count']].sum()
+disponibilidad_estacion = (
+    (totales['sum'] / totales['count']).round(2).rename('disponibilidad').reset_index()
+)
+disponibilidad_estacion["var_disp"] = clasificar_disponibilidad(disponibilidad_estacion["disponibilidad"])
 
 
 
 
 # ALERTAS POR DISPONIBILIDAD DE ESTACION
-# Paso 1: Clasificar la disponibilidad (ya tienes tu función clasificar_disponibilidad)
-disponibilidad_estacion["var_disp"] = disponibilidad_estacion["disponibilidad"].apply(clasificar_disponibilidad)
+# Paso 1: La disponibilidad ya quedó clasificada en 'var_disp' al calcular disponibilidad_estacion
 # Paso 2: Agrupar y contar por categoría de disponibilidad
 conteo_por_categoria = disponibilidad_estacion.groupby("var_disp").size().reset_index(name='Conteo')
 print(conteo_por_categoria)
 
 # Paso 3: Alertar las estaciones según categoría de disponibilidad
+# Subconjuntos por categoría obtenidos en una sola pasada
+grupos_alerta = dict(list(disponibilidad_estacion.groupby("var_disp", sort=False)))
+sin_estaciones = disponibilidad_estacion.iloc[0:0]
 # Alerta para "Problemas de disponibilidad (≥ 30%)"
-media_disponibilidad = disponibilidad_estacion[disponibilidad_estacion["var_disp"] == "Problemas de disponibilidad (≥ 30%)"]
+media_disponibilidad = grupos_alerta.get("Problemas de disponibilidad (≥ 30%)", sin_estaciones)
 if not media_disponibilidad.empty:
     print("\n🚨 Estaciones con PROBLEMAS DE DISPONIBILIDAD (≥ 30%):")
-    for idx, row in media_disponibilidad.iterrows():
-        print(f" - DZ: {row['DZ']} | Estación: {row['Estacion']} ({row['disponibilidad']}%)")
+    for dz, estacion, disp in media_disponibilidad[['DZ', 'Estacion', 'disponibilidad']].itertuples(index=False, name=None):
+        print(f" - DZ: {dz} | Estación: {estacion} ({disp}%)")
 else:
     print("\n✅ No hay estaciones con problemas de disponibilidad (≥ 30%).")
 
 # Alerta para "Problemas de disponibilidad (< 30%)"
-baja_disponibilidad = disponibilidad_estacion[disponibilidad_estacion["var_disp"] == "Problemas de disponibilidad (< 30%)"]
+baja_disponibilidad = grupos_alerta.get("Problemas de disponibilidad (< 30%)", sin_estaciones)
 if not baja_disponibilidad.empty:
     print("\n🚨 Estaciones con PROBLEMAS DE DISPONIBILIDAD (< 30%):")
-    for idx, row in baja_disponibilidad.iterrows():
-        print(f" - DZ: {row['DZ']} | Estación: {row['Estacion']} ({row['disponibilidad']}%)")
+    for dz, estacion, disp in baja_disponibilidad[['DZ', 'Estacion', 'disponibilidad']].itertuples(index=False, name=None):
+        print(f" - DZ: {dz} | Estación: {estacion} ({disp}%)")
 else:
     print("\n✅ No hay estaciones con problemas de disponibilidad (< 30%).")
 
 # Alerta para "No recibido en el período"
-sin_disponibilidad = disponibilidad_estacion[disponibilidad_estacion["var_disp"] == "No recibido en el período"]
+sin_disponibilidad = grupos_alerta.get("No recibido en el período", sin_estaciones)
 if not sin_disponibilidad.empty:
     print("\n🚨 Estaciones SIN DISPONIBILIDAD en el período:")
-    for idx, row in sin_disponibilidad.iterrows():
-        print(f" - DZ: {row['DZ']} | Estación: {row['Estacion']} ({row['disponibilidad']}%)")
+    for dz, estacion, disp in sin_disponibilidad[['DZ', 'Estacion', 'disponibilidad']].itertuples(index=False, name=None):
+        print(f" - DZ: {dz} | Estación: {estacion} ({disp}%)")
 else:
     print("\n✅ No hay estaciones sin disponibilidad en el período.")
 
@@ -300,10 +371,13 @@ rango_fechas = '_'.join(partes[-2:])
 archivo_salida = f"reporte_disponibilidad_{rango_fechas}.xlsx"
 
 # Crear un archivo Excel con múltiples hojas
-with pd.ExcelWriter(archivo_salida, engine='xlsxwriter') as writer:
-    disponibilidad_estacion.to_excel(writer, sheet_name='POR ESTACION', index=False)
-    disponibilidad_equipamiento.to_excel(writer, sheet_name='POR EQUIPAMIENTO', index=False)
-    disponibilidad_variable.to_excel(writer, sheet_name='POR VARIABLE', index=False)
+# constant_memory vuelca cada fila a disco al pasar a la siguiente, por eso las hojas
+# se escriben fila por fila (to_excel escribe por columnas y no es compatible)
+with xlsxwriter.Workbook(archivo_salida, {'constant_memory': True}) as workbook:
+    formato_encabezado = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+    escribir_hoja(workbook, 'POR ESTACION', disponibilidad_estacion, formato_encabezado)
+    escribir_hoja(workbook, 'POR EQUIPAMIENTO', disponibilidad_equipamiento, formato_encabezado)
+    escribir_hoja(workbook, 'POR VARIABLE', disponibilidad_variable, formato_encabezado)
 
 
 """
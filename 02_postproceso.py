@@ -20,37 +20,127 @@ Reglas implementadas:
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import xlsxwriter
+
+# Lector de Excel en Rust (calamine, pandas>=2.2) si está instalado; si no, openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Texto en buffers de Arrow (strip con kernels vectorizados) si pyarrow está instalado; si no, str
+try:
+    import pyarrow  # noqa: F401
+    TEXTO_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXTO_DTYPE = str
 
 SHEET_NAME = "POR ESTACION"
 SHEET_EQUIPAMIENTO = "POR EQUIPAMIENTO"
 SHEET_VARIABLE = "POR VARIABLE"
 OUTFILE = "reporte_disponibilidad_consolidado.xlsx"
+# Columnas de la hoja POR ESTACION que usa el consolidado de cada reporte (el resto no se lee).
+# var_disp no se lee: se reclasifica a partir de la disponibilidad numérica
+COLUMNAS_PREVIO = frozenset({"DZ", "Estacion", "disponibilidad", "f_inci", "estado_inci", "comentario"})
+COLUMNAS_ACTUAL = frozenset({"DZ", "Estacion", "disponibilidad"})
 
 def clean_input_path(s: str) -> str:
     return s.strip().strip('"').strip("'")
 
-def clasificar_var_disp_num(p):
-    try:
-        if pd.isna(p):
-            return "No recibido en el período"
-        p = float(p)
-    except Exception:
-        return "No recibido en el período"
-    if p > 100:
-        return "Más del 100%"
-    if p >= 80:
-        return "Normal (≥ 80%)"
-    if p >= 30:
-        return "Problemas de disponibilidad (≥ 30%)"
-    if p > 0:
-        return "Problemas de disponibilidad (< 30%)"
-    if p == 0:
-        return "No recibido en el período"
-    return "No recibido en el período"
-
-def safe_read(path, sheet_name=SHEET_NAME):
-    return pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl")
+# Categorías de var_disp indexadas por código (ver clasificar_var_disp)
+CATEGORIAS_VAR_DISP = pd.CategoricalDtype([
+    "No recibido en el período",            # 0: NaN, 0 o negativo
+    "Más del 100%",                         # 1: > 100
+    "Normal (≥ 80%)",                       # 2: [80, 100]
+    "Problemas de disponibilidad (≥ 30%)",  # 3: [30, 80)
+    "Problemas de disponibilidad (< 30%)",  # 4: (0, 30)
+])
+CODIGO_NORMAL = CATEGORIAS_VAR_DISP.categories.get_loc("Normal (≥ 80%)")
+
+def clasificar_var_disp(disponibilidad):
+    """Clasifica una Series de disponibilidad (%) en var_disp, sin recorrerla fila por fila"""
+    d = pd.to_numeric(disponibilidad, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    # Códigos int8 asignados de menor a mayor prioridad (NaN no cumple ninguna condición)
+    codigos = np.zeros(d.shape, dtype=np.int8)
+    codigos[d > 0] = 4
+    codigos[d >= 30] = 3
+    codigos[d >= 80] = 2
+    codigos[d > 100] = 1
+    return pd.Categorical.from_codes(codigos, dtype=CATEGORIAS_VAR_DISP)
+
+# Estados de incidencia y origen de cada estación en el consolidado
+ESTADOS_INCI = ["Sin incidencia", "Nueva", "Recurrente", "Solucionado"]
+FUENTES = ["anterior", "actual", "ambos"]
+
+def safe_read(path, sheet_name=SHEET_NAME, usecols=None):
+    return pd.read_excel(path, sheet_name=sheet_name, engine=EXCEL_ENGINE, usecols=usecols)
+
+def filtro_columnas(columnas):
+    """usecols para read_excel: solo los encabezados (sin espacios, igual que al normalizarlos) en columnas"""
+    return lambda col: isinstance(col, str) and col.strip() in columnas
+
+def escribir_tabla(ws, fila_inicio, df, formato_encabezado=None, formatos_columna=None):
+    """
+    Escribe el encabezado y las filas de un DataFrame en una hoja de xlsxwriter,
+    a partir de fila_inicio (las filas deben escribirse en orden con constant_memory).
+
+    Parámetros:
+    - ws: hoja de xlsxwriter
+    - fila_inicio: int, fila del encabezado
+    - df: DataFrame a escribir (sin índice)
+    - formato_encabezado: formato opcional para la fila de encabezado
+    - formatos_columna: dict opcional {columna: {valor: formato}} para dar formato a cada
+      celda de esa columna según su valor (valores fuera del dict quedan sin formato)
+    """
+    ws.write_row(fila_inicio, 0, df.columns.tolist(), formato_encabezado)
+    # object + None: categóricas como sus valores y NaN/NaT/NA como celda vacía
+    valores = df.astype(object).where(df.notna(), None)
+    # (índice de columna, formato de cada fila) para las columnas con formato según su valor
+    columnas = df.columns.tolist()
+    con_formato = [
+        (columnas.index(col), [mapa.get(v) for v in valores[col]])
+        for col, mapa in (formatos_columna or {}).items()
+    ]
+    for i, registro in enumerate(valores.itertuples(index=False, name=None)):
+        fila = fila_inicio + 1 + i
+        ws.write_row(fila, 0, registro)
+        # la fila actual sigue en memoria: se puede reescribir la celda con su formato
+        for col, formatos in con_formato:
+            if formatos[i] is not None:
+                ws.write(fila, col, registro[col], formatos[i])
+
+def leer_filas(libro, sheet_name):
+    """
+    Lee los valores de una hoja de un pd.ExcelFile abierto, sin pasar por un DataFrame
+    (para las hojas que se copian tal cual al archivo de salida).
+
+    Retorna:
+    - list de filas (encabezado incluido), sin las filas vacías del final
+    """
+    if EXCEL_ENGINE == "calamine":
+        filas = libro.book.get_sheet_by_name(sheet_name).to_python()
+    else:
+        filas = list(libro.book[sheet_name].iter_rows(values_only=True))
+    # el rango declarado de la hoja puede incluir filas vacías al final
+    while filas and all(v is None or v == "" for v in filas[-1]):
+        filas.pop()
+    return filas
+
+def escribir_hoja(workbook, nombre_hoja, df, formato_encabezado=None, formatos_columna=None):
+    """Crea la hoja nombre_hoja, escribe el DataFrame desde la fila 0 y retorna la hoja"""
+    ws = workbook.add_worksheet(nombre_hoja)
+    escribir_tabla(ws, 0, df, formato_encabezado, formatos_columna)
+    return ws
+
+def copiar_hoja(workbook, nombre_hoja, filas, formato_encabezado=None):
+    """Crea la hoja nombre_hoja con las filas leídas por leer_filas (la primera como encabezado) y retorna la hoja"""
+    ws = workbook.add_worksheet(nombre_hoja)
+    for i, fila in enumerate(filas):
+        ws.write_row(i, 0, fila, formato_encabezado if i == 0 else None)
+    return ws
 
 def input_date_ddmmyyyy(prompt):
     while True:
@@ -77,24 +167,31 @@ if not p_act.exists():
     raise FileNotFoundError(f"No existe archivo actual: {p_act.resolve()}")
 
 # ----- Carga -----
-df_prev = safe_read(p_prev, SHEET_NAME)
-df_act = safe_read(p_act, SHEET_NAME)
+# Hojas adicionales del reporte nuevo: se copian tal cual, como filas de valores
+filas_equipamiento = None
+filas_variable = None
 
-# Leer hojas adicionales del reporte nuevo
-df_equipamiento = None
-df_variable = None
+# Los dos reportes son archivos independientes: el anterior se lee en un hilo mientras se lee
+# el nuevo (la descompresión zlib libera el GIL). Las hojas del nuevo comparten un mismo libro
+# abierto, que no es seguro entre hilos, así que se leen en orden en el hilo principal
+with ThreadPoolExecutor(max_workers=1) as ex, pd.ExcelFile(p_act, engine=EXCEL_ENGINE) as libro_act:
+    fut_prev = ex.submit(safe_read, p_prev, SHEET_NAME, usecols=filtro_columnas(COLUMNAS_PREVIO))
 
-try:
-    df_equipamiento = safe_read(p_act, SHEET_EQUIPAMIENTO)
-    print(f"✓ Hoja '{SHEET_EQUIPAMIENTO}' cargada ({len(df_equipamiento)} filas)")
-except Exception as e:
-    print(f"⚠ No se pudo cargar la hoja '{SHEET_EQUIPAMIENTO}': {e}")
+    df_act = safe_read(libro_act, SHEET_NAME, usecols=filtro_columnas(COLUMNAS_ACTUAL))
 
-try:
-    df_variable = safe_read(p_act, SHEET_VARIABLE)
-    print(f"✓ Hoja '{SHEET_VARIABLE}' cargada ({len(df_variable)} filas)")
-except Exception as e:
-    print(f"⚠ No se pudo cargar la hoja '{SHEET_VARIABLE}': {e}")
+    try:
+        filas_equipamiento = leer_filas(libro_act, SHEET_EQUIPAMIENTO)
+        print(f"✓ Hoja '{SHEET_EQUIPAMIENTO}' cargada ({max(len(filas_equipamiento) - 1, 0)} filas)")
+    except Exception as e:
+        print(f"⚠ No se pudo cargar la hoja '{SHEET_EQUIPAMIENTO}': {e}")
+
+    try:
+        filas_variable = leer_filas(libro_act, SHEET_VARIABLE)
+        print(f"✓ Hoja '{SHEET_VARIABLE}' cargada ({max(len(filas_variable) - 1, 0)} filas)")
+    except Exception as e:
+        print(f"⚠ No se pudo cargar la hoja '{SHEET_VARIABLE}': {e}")
+
+    df_prev = fut_prev.result()
 
 # Normalizar nombres columnas y asegurar existencia
 for df in (df_prev, df_act):
@@ -115,8 +212,8 @@ for c in ["f_inci", "estado_inci", "comentario"]:
 # Normalizar tipos y limpiar strings
 df_act["DZ"] = df_act["DZ"].astype(pd.Int64Dtype())
 df_prev["DZ"] = df_prev["DZ"].astype(pd.Int64Dtype())
-df_act["Estacion"] = df_act["Estacion"].astype(str).str.strip()
-df_prev["Estacion"] = df_prev["Estacion"].astype(str).str.strip()
+df_act["Estacion"] = df_act["Estacion"].astype(TEXTO_DTYPE).str.strip()
+df_prev["Estacion"] = df_prev["Estacion"].astype(TEXTO_DTYPE).str.strip()
 
 # Normalizar fechas en prev
 if "f_inci" in df_prev.columns:
@@ -126,8 +223,8 @@ if "f_inci" in df_prev.columns:
 df_act["disponibilidad"] = pd.to_numeric(df_act["disponibilidad"], errors="coerce")
 df_prev["disponibilidad"] = pd.to_numeric(df_prev["disponibilidad"], errors="coerce")
 
-df_act["var_disp_cls"] = df_act["disponibilidad"].apply(clasificar_var_disp_num)
-df_prev["var_disp_cls"] = df_prev["disponibilidad"].apply(clasificar_var_disp_num)
+df_act["var_disp_cls"] = clasificar_var_disp(df_act["disponibilidad"])
+df_prev["var_disp_cls"] = clasificar_var_disp(df_prev["disponibilidad"])
 
 # Renombrar columnas preparadas para merge
 df_act_proc = df_act[["DZ", "Estacion", "disponibilidad", "var_disp_cls"]].rename(
@@ -135,116 +232,129 @@ df_act_proc = df_act[["DZ", "Estacion", "disponibilidad", "var_disp_cls"]].renam
 df_prev_proc = df_prev[["DZ", "Estacion", "disponibilidad", "var_disp_cls", "f_inci", "estado_inci", "comentario"]].rename(
     columns={"disponibilidad": "disponibilidad_prev", "var_disp_cls": "var_disp_prev"})
 
-# Merge outer por (DZ, Estacion)
-merged = pd.merge(df_act_proc, df_prev_proc, how="outer", on=["DZ", "Estacion"], indicator=True)
-
-# Función para determinar estado según reglas finales
-def determinar_estado(row, fecha_ref):
-    # obtener variables
-    var_act = row.get("var_disp_act")
-    var_prev = row.get("var_disp_prev")
-    estado_prev = row.get("estado_inci")
-    f_inci_prev = row.get("f_inci")
-    merge_flag = row.get("_merge")
-
-    # Normalizar strings
-    if isinstance(var_act, float) and np.isnan(var_act):
-        var_act = None
-    if isinstance(var_prev, float) and np.isnan(var_prev):
-        var_prev = None
-    if pd.isna(estado_prev):
-        estado_prev = None
-
-    # helpers
-    def is_incidence(var):  # var is one of categories
-        return var is not None and var != "Normal (≥ 80%)"
-
-    # Caso: solo en previo (no aparece en nuevo)
-    if merge_flag == "right_only":
-        # conservar estado_prev (si existe), sino mantener como 'Sin incidencia' o 'Inactivo'
-        return {
-            "estado_inci": estado_prev if estado_prev is not None else "Sin incidencia",
-            "f_inci": f_inci_prev,
-            "comentario": row.get("comentario")
-        }
-
-    # Caso: solo en actual (nueva estación en lista actual)
-    if merge_flag == "left_only":
-        if var_act is None:
-            return {"estado_inci": "Sin incidencia", "f_inci": pd.NaT, "comentario": pd.NA}
-        if is_incidence(var_act):
-            # si hay incidencia y no estaba antes -> Nueva (analista pone f_inci)
-            return {"estado_inci": "Nueva", "f_inci": pd.NaT, "comentario": pd.NA}
-        else:
-            return {"estado_inci": "Sin incidencia", "f_inci": pd.NaT, "comentario": pd.NA}
-
-    # Caso: en ambos
-    # si var_act es None, tratar como 0 (No recibido)
-    if var_act is None:
-        var_act = "No recibido en el período"
-
-    if not is_incidence(var_act):  # actual Normal
-        # si antes tenía incidencia -> Solucionado
-        if estado_prev in ("Nueva", "Recurrente"):
-            return {"estado_inci": "Solucionado", "f_inci": f_inci_prev, "comentario": row.get("comentario")}
-        else:
-            # conservar comentario anterior si existe
-            return {"estado_inci": "Sin incidencia", "f_inci": pd.NaT, "comentario": row.get("comentario")}
+# Estacion como categórica con las mismas categorías (ordenadas) en ambos lados,
+# de modo que las búsquedas por clave comparen códigos enteros en lugar de strings
+tipo_estacion = pd.CategoricalDtype(
+    np.sort(pd.concat([df_act_proc["Estacion"], df_prev_proc["Estacion"]]).dropna().unique())
+)
+act_idx = df_act_proc.astype({"Estacion": tipo_estacion}).set_index(["DZ", "Estacion"])
+prev_idx = df_prev_proc.astype({"Estacion": tipo_estacion}).set_index(["DZ", "Estacion"])
+
+# Cada estación debe aparecer una sola vez en cada reporte
+for nombre_reporte, indice in (("nuevo", act_idx.index), ("anterior", prev_idx.index)):
+    if not indice.is_unique:
+        duplicadas = indice[indice.duplicated()].unique().tolist()
+        raise ValueError(f"Estaciones (DZ, Estacion) duplicadas en el reporte {nombre_reporte}: {duplicadas}")
+
+# Cruce por (DZ, Estacion) equivalente a un merge outer: las filas del actual toman las columnas
+# del previo con un reindex por índice y las estaciones solo del previo se agregan al final
+en_prev = act_idx.index.isin(prev_idx.index)
+solo_en_prev = ~prev_idx.index.isin(act_idx.index)
+merged = pd.concat([
+    pd.concat([act_idx, prev_idx.reindex(act_idx.index)], axis=1),
+    prev_idx[solo_en_prev],
+])
+merged["_merge"] = pd.Categorical(
+    np.concatenate([np.where(en_prev, "both", "left_only"), np.full(solo_en_prev.sum(), "right_only")]),
+    categories=["left_only", "right_only", "both"]
+)
+merged = merged.astype({"var_disp_act": CATEGORIAS_VAR_DISP, "var_disp_prev": CATEGORIAS_VAR_DISP}).reset_index()
+
+# Función para determinar estado según reglas finales (sobre todo el merge a la vez)
+def determinar_estados(merged, fecha_ref):
+    """
+    Aplica las reglas de estado a cada fila del merge outer entre actual y previo.
+
+    Retorna:
+    - (estado_inci, f_inci, comentario): arrays object alineados con merged
+    """
+    origen = merged["_merge"].to_numpy(dtype=object)
+    solo_prev = origen == "right_only"
+    solo_act = origen == "left_only"
+    ambos = origen == "both"
+
+    # var_disp actual: Normal o no; en 'ambos' si falta se trata como 'No recibido' (incidencia)
+    # (comparación de códigos int8 de CATEGORIAS_VAR_DISP; -1 = sin dato)
+    codigos_act = merged["var_disp_act"].cat.codes.to_numpy()
+    act_presente = codigos_act >= 0
+    act_normal = codigos_act == CODIGO_NORMAL
+
+    estado_prev = merged["estado_inci"]
+    ep = estado_prev.to_numpy(dtype=object)
+    prev_presente = estado_prev.notna().to_numpy()
+    # una sola pasada sobre estado_inci previo: códigos de Nueva (0) / Recurrente (1), -1 para el resto o NA
+    codigos_prev = pd.Index(["Nueva", "Recurrente"]).get_indexer(ep)
+    prev_nueva = codigos_prev == 0
+    prev_abierta = codigos_prev >= 0
+
+    # Tolerancia de 5 días desde f_inci previa (sin fecha no se puede evaluar)
+    # (aritmética de días enteros sobre datetime64[D]; NaT = sin fecha)
+    f_prev = pd.to_datetime(merged["f_inci"], errors="coerce").to_numpy(dtype="datetime64[D]")
+    dias = (np.datetime64(fecha_ref, "D") - f_prev).astype(np.int64)
+    dentro_tolerancia = ~np.isnat(f_prev) & (dias <= 5)
+
+    # Reglas en orden de evaluación; la primera que se cumple define el estado
+    estado = np.select(
+        [
+            solo_prev,                                      # solo en previo: conservar estado previo
+            solo_act & act_presente & ~act_normal,          # nueva estación con incidencia
+            solo_act,
+            ambos & act_normal & prev_abierta,              # actual Normal y antes tenía incidencia
+            ambos & act_normal,
+            ambos & prev_nueva & dentro_tolerancia,         # sigue con problema, aún en tolerancia
+            ambos & prev_abierta,                           # sigue con problema -> Recurrente
+        ],
+        [
+            np.where(prev_presente, ep, "Sin incidencia"),
+            "Nueva",
+            "Sin incidencia",
+            "Solucionado",
+            "Sin incidencia",
+            "Nueva",
+            "Recurrente",
+        ],
+        default="Nueva",  # incidencia sin estado previo abierto
+    ).astype(object)
 
-    else:
-        # actual tiene incidencia
-        if estado_prev in (None, "Sin incidencia"):
-            # antes no tenía -> Nueva
-            return {"estado_inci": "Nueva", "f_inci": pd.NaT, "comentario": pd.NA}
-        if estado_prev in ("Nueva", "Recurrente"):
-            # aplicar tolerancia si prev fue Nueva
-            if estado_prev == "Nueva":
-                if isinstance(f_inci_prev, (datetime, )):
-                    f_inci_prev_date = f_inci_prev.date()
-                else:
-                    f_inci_prev_date = f_inci_prev  # already date or None
-                # Verificar si es None o pd.NaT
-                if f_inci_prev_date is None or pd.isna(f_inci_prev_date):
-                    # no fecha previa: mantener Recurrente (no hay dato para evaluar)
-                    return {"estado_inci": "Recurrente", "f_inci": f_inci_prev, "comentario": row.get("comentario")}
-                # si han pasado >5 días desde f_inci_prev y sigue con problema -> Recurrente
-                if (fecha_ref - f_inci_prev_date) > timedelta(days=5):
-                    return {"estado_inci": "Recurrente", "f_inci": f_inci_prev, "comentario": row.get("comentario")}
-                else:
-                    # aún dentro de tolerancia -> mantener Nueva
-                    return {"estado_inci": "Nueva", "f_inci": f_inci_prev, "comentario": row.get("comentario")}
-            else:
-                # prev era Recurrente -> mantener Recurrente
-                return {"estado_inci": "Recurrente", "f_inci": f_inci_prev, "comentario": row.get("comentario")}
-        # Otros casos fallback
-        return {"estado_inci": "Nueva", "f_inci": pd.NaT, "comentario": pd.NA}
+    # f_inci y comentario previos se conservan solo en los casos que continúan una incidencia
+    conserva_f = solo_prev | (ambos & prev_abierta)
+    conserva_com = solo_prev | (ambos & (act_normal | prev_abierta))
+    f_inci = np.where(conserva_f, merged["f_inci"].to_numpy(dtype=object), pd.NaT)
+    comentario = np.where(conserva_com, merged["comentario"].to_numpy(dtype=object), pd.NA)
+    return estado, f_inci, comentario
 
 # Aplicar determinación
-res_list = []
-for _, row in merged.iterrows():
-    r = determinar_estado(row, fecha_ref)
-    res = {
-        "DZ": row.get("DZ"),
-        "Estacion": row.get("Estacion"),
-        "disponibilidad": row.get("disponibilidad_act") if row.get("_merge") in ("both", "left_only") else 0.0,
-        "var_disp": row.get("var_disp_act") if row.get("_merge") in ("both", "left_only") and pd.notna(row.get("var_disp_act")) else row.get("var_disp_prev"),
-        "f_inci": r["f_inci"],
-        "estado_inci": r["estado_inci"],
-        "comentario": r["comentario"],
-        "fuente": "ambos" if row.get("_merge")=="both" else ("actual" if row.get("_merge")=="left_only" else "anterior")
-    }
-    # asegurar var_disp clasificada (si quedó NaN)
-    if pd.isna(res["var_disp"]):
-        res["var_disp"] = clasificar_var_disp_num(res["disponibilidad"])
-    res_list.append(res)
-
-df_final = pd.DataFrame(res_list)
-
-# Normalizar tipos y ordenar
-df_final["DZ"] = df_final["DZ"].astype(pd.Int64Dtype())
-df_final["Estacion"] = df_final["Estacion"].astype(str).str.strip()
-df_final["disponibilidad"] = pd.to_numeric(df_final["disponibilidad"], errors="coerce").fillna(0.0).astype(float)
-df_final = df_final.sort_values(by=["DZ", "Estacion"], ascending=[True, True]).reset_index(drop=True)
+estado_inci, f_inci, comentario = determinar_estados(merged, fecha_ref)
+
+# Construcción de df_final por columnas, sin recorrer filas
+origen = merged["_merge"].to_numpy(dtype=object)
+en_act = origen != "right_only"  # 'both' o 'left_only': se toman los valores actuales
+disponibilidad = merged["disponibilidad_act"].where(en_act, 0.0)
+var_act = merged["var_disp_act"]
+var_disp = var_act.where(en_act & (var_act.cat.codes.to_numpy() >= 0), merged["var_disp_prev"])
+# asegurar var_disp clasificada (si quedó NaN)
+var_disp = var_disp.fillna(pd.Series(clasificar_var_disp(disponibilidad), index=merged.index))
+
+# Columnas de pocos valores como categóricas (códigos enteros en lugar de un str por fila).
+# estado_inci puede traer del reporte anterior valores fuera de ESTADOS_INCI: se agregan al final
+extras_estado = [e for e in pd.unique(estado_inci) if e not in ESTADOS_INCI]
+codigos_fuente = np.select([origen == "both", origen == "left_only"], [2, 1], default=0)
+
+# Tipos finales desde el origen (DZ Int64, Estacion categórica ya sin espacios, disponibilidad
+# float sin NaN): no hace falta normalizar df_final después de construirlo
+df_final = pd.DataFrame({
+    "DZ": merged["DZ"].array,
+    "Estacion": merged["Estacion"].array,
+    "disponibilidad": disponibilidad.fillna(0.0).to_numpy(dtype=float),
+    "var_disp": var_disp.array,
+    "f_inci": f_inci,
+    "estado_inci": pd.Categorical(estado_inci, categories=ESTADOS_INCI + extras_estado),
+    "comentario": comentario,
+    "fuente": pd.Categorical.from_codes(codigos_fuente, categories=FUENTES),
+})
+
+# Ordenar (Estacion se ordena por sus códigos: las categorías ya están en orden alfabético)
+df_final = df_final.sort_values(by=["DZ", "Estacion"], kind="mergesort", ignore_index=True)
 
 # Indicadores globales
 total_est = len(df_final)
@@ -256,66 +366,63 @@ cnt_sin_datos = int((df_final["disponibilidad"] == 0).sum())
 pct_ge80 = round((df_final["disponibilidad"] >= 80).sum() / max(total_est,1) * 100, 2)
 
 # Indicadores por DZ
-agg_dz = df_final.groupby("DZ").agg(
+# Indicadores 0/1 por fila: los conteos por grupo son sumas (Cython), sin lambdas por grupo
+estado = df_final["estado_inci"]
+indicadores = pd.DataFrame({
+    "DZ": df_final["DZ"],
+    "Estacion": df_final["Estacion"],
+    "disponibilidad": df_final["disponibilidad"],
+    "n_ge80": df_final["disponibilidad"].ge(80),
+    "n_nueva": estado.eq("Nueva"),
+    "n_recurrente": estado.eq("Recurrente"),
+    "n_solucionado": estado.eq("Solucionado"),
+    "n_sin": estado.eq("Sin incidencia"),
+    "n_sin_datos": df_final["disponibilidad"].eq(0),
+})
+agg_dz = indicadores.groupby("DZ").agg(
     estaciones=("Estacion", "count"),
     avg_disponibilidad=("disponibilidad", "mean"),
-    pct_ge80=("disponibilidad", lambda s: round((s>=80).sum()/max(len(s),1)*100,2)),
-    n_nueva=("estado_inci", lambda s: int((s=="Nueva").sum())),
-    n_recurrente=("estado_inci", lambda s: int((s=="Recurrente").sum())),
-    n_solucionado=("estado_inci", lambda s: int((s=="Solucionado").sum())),
-    n_sin=("estado_inci", lambda s: int((s=="Sin incidencia").sum())),
-    n_sin_datos=("disponibilidad", lambda s: int((s==0).sum()))
-).reset_index()
+    n_ge80=("n_ge80", "sum"),
+    n_nueva=("n_nueva", "sum"),
+    n_recurrente=("n_recurrente", "sum"),
+    n_solucionado=("n_solucionado", "sum"),
+    n_sin=("n_sin", "sum"),
+    n_sin_datos=("n_sin_datos", "sum")
+)
+agg_dz.insert(2, "pct_ge80", (agg_dz.pop("n_ge80") / agg_dz["estaciones"] * 100).round(2))
+agg_dz = agg_dz.reset_index()
 
 # Exportar Excel con xlsxwriter y formatos por estado/var_disp
-with pd.ExcelWriter(OUTFILE, engine="xlsxwriter", datetime_format="dd/mm/yyyy") as writer:
+# constant_memory vuelca cada fila a disco al pasar a la siguiente, por eso todas las hojas
+# se escriben fila por fila y en orden (to_excel escribe por columnas y no es compatible)
+with xlsxwriter.Workbook(OUTFILE, {"constant_memory": True, "default_date_format": "YYYY-MM-DD"}) as workbook:
     # ===== Hoja 1: POR ESTACION (consolidada) =====
-    df_final.to_excel(writer, sheet_name="POR ESTACION", index=False)
-    workbook  = writer.book
-    ws = writer.sheets["POR ESTACION"]
-
-    # Encabezado manual para estética
     header_fmt = workbook.add_format({"bold": True, "align": "center"})
-    for col_num, value in enumerate(df_final.columns.values):
-        ws.write(0, col_num, value, header_fmt)
 
     # Formatos por estado_inci
     fmt_nueva = workbook.add_format({"bg_color": "#FFC7CE"})       # rojo claro
     fmt_recurrente = workbook.add_format({"bg_color": "#FFEB9C"})  # amarillo
     fmt_solucionado = workbook.add_format({"bg_color": "#C6EFCE"}) # verde claro
-    fmt_sin = workbook.add_format({"bg_color": "#FFFFFF"})         # blanco
-
-    # Aplicar formato condicional sobre columna 'estado_inci' (col index)
-    col_idx_estado = list(df_final.columns).index("estado_inci")
-    first_row = 2
-    last_row = 1 + len(df_final)
-    rng = f"{chr(65+col_idx_estado)}{first_row}:{chr(65+col_idx_estado)}{last_row}"
-    ws.conditional_format(rng, {"type": "text",
-                                "criteria": "containing",
-                                "value": "Nueva",
-                                "format": fmt_nueva})
-    ws.conditional_format(rng, {"type": "text",
-                                "criteria": "containing",
-                                "value": "Recurrente",
-                                "format": fmt_recurrente})
-    ws.conditional_format(rng, {"type": "text",
-                                "criteria": "containing",
-                                "value": "Solucionado",
-                                "format": fmt_solucionado})
-
-    # Formato por var_disp (col)
-    col_idx_var = list(df_final.columns).index("var_disp")
-    rng_var = f"{chr(65+col_idx_var)}{first_row}:{chr(65+col_idx_var)}{last_row}"
-    ws.conditional_format(rng_var, {"type": "text", "criteria": "containing", "value": "Más del 100%", "format": fmt_nueva})
-    ws.conditional_format(rng_var, {"type": "text", "criteria": "containing", "value": "No recibido en el período", "format": fmt_nueva})
-    ws.conditional_format(rng_var, {"type": "text", "criteria": "containing", "value": "Problemas de disponibilidad (< 30%)", "format": fmt_recurrente})
-    ws.conditional_format(rng_var, {"type": "text", "criteria": "containing", "value": "Problemas de disponibilidad (≥ 30%)", "format": fmt_recurrente})
+
+    # Relleno fijo por celda según su valor (los datos no cambian: no hacen falta reglas de
+    # formato condicional que Excel reevalúa al abrir); 'Sin incidencia' y 'Normal' sin color
+    formatos_estado = {
+        "Nueva": fmt_nueva,
+        "Recurrente": fmt_recurrente,
+        "Solucionado": fmt_solucionado,
+    }
+    formatos_var_disp = {
+        "Más del 100%": fmt_nueva,
+        "No recibido en el período": fmt_nueva,
+        "Problemas de disponibilidad (< 30%)": fmt_recurrente,
+        "Problemas de disponibilidad (≥ 30%)": fmt_recurrente,
+    }
+    ws = escribir_hoja(workbook, "POR ESTACION", df_final, header_fmt,
+                       formatos_columna={"estado_inci": formatos_estado, "var_disp": formatos_var_disp})
     ws.set_column(0, len(df_final.columns)-1, 18)
 
     # ===== Hoja 2: Indicadores =====
     sheet_ind = "Indicadores"
-    agg_dz.to_excel(writer, sheet_name=sheet_ind, index=False, startrow=10)
-    ws2 = writer.sheets[sheet_ind]
     # Totales globales
     resumen_tot = pd.DataFrame({
         "indicador": [
@@ -337,33 +444,25 @@ with pd.ExcelWriter(OUTFILE, engine="xlsxwriter", datetime_format="dd/mm/yyyy")
             pct_ge80
         ]
     })
-    resumen_tot.to_excel(writer, sheet_name=sheet_ind, index=False, startrow=0)
+    # En orden de filas: totales desde la fila 0 e indicadores por DZ desde la fila 10
+    ws2 = escribir_hoja(workbook, sheet_ind, resumen_tot, header_fmt)
+    escribir_tabla(ws2, 10, agg_dz, header_fmt)
     
     # ===== Hoja 3: POR EQUIPAMIENTO (copia del reporte nuevo) =====
-    if df_equipamiento is not None:
-        df_equipamiento.to_excel(writer, sheet_name=SHEET_EQUIPAMIENTO, index=False)
-        ws_equip = writer.sheets[SHEET_EQUIPAMIENTO]
-        
-        # Aplicar formato de encabezado
-        for col_num, value in enumerate(df_equipamiento.columns.values):
-            ws_equip.write(0, col_num, value, header_fmt)
+    if filas_equipamiento is not None:
+        ws_equip = copiar_hoja(workbook, SHEET_EQUIPAMIENTO, filas_equipamiento, header_fmt)
         
         # Ajustar ancho de columnas
-        ws_equip.set_column(0, len(df_equipamiento.columns)-1, 18)
+        ws_equip.set_column(0, max(map(len, filas_equipamiento), default=1)-1, 18)
         
         print(f"✓ Hoja '{SHEET_EQUIPAMIENTO}' agregada al archivo de salida")
     
     # ===== Hoja 4: POR VARIABLE (copia del reporte nuevo) =====
-    if df_variable is not None:
-        df_variable.to_excel(writer, sheet_name=SHEET_VARIABLE, index=False)
-        ws_var = writer.sheets[SHEET_VARIABLE]
-        
-        # Aplicar formato de encabezado
-        for col_num, value in enumerate(df_variable.columns.values):
-            ws_var.write(0, col_num, value, header_fmt)
+    if filas_variable is not None:
+        ws_var = copiar_hoja(workbook, SHEET_VARIABLE, filas_variable, header_fmt)
         
         # Ajustar ancho de columnas
-        ws_var.set_column(0, len(df_variable.columns)-1, 18)
+        ws_var.set_column(0, max(map(len, filas_variable), default=1)-1, 18)
         
         print(f"✓ Hoja '{SHEET_VARIABLE}' agregada al archivo de salida")
 
@@ -384,9 +483,9 @@ print(f"\nArchivo generado: {Path(OUTFILE).resolve()}")
 # Mostrar resumen de hojas incluidas
 print("\n---- Hojas incluidas en el archivo ----")
 hojas_generadas = ["POR ESTACION (consolidada)", "Indicadores"]
-if df_equipamiento is not None:
+if filas_equipamiento is not None:
     hojas_generadas.append(SHEET_EQUIPAMIENTO)
-if df_variable is not None:
+if filas_variable is not None:
     hojas_generadas.append(SHEET_VARIABLE)
 for i, hoja in enumerate(hojas_generadas, 1):
     print(f"{i}. {hoja}")
@@ -10,52 +10,30 @@ import csv
 import unicodedata
 import datetime
 import locale
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 
-# Preguntar al usuario por el tipo de red
-tipo_red = ''
-while tipo_red not in ['automatica', 'convencional']:
-    tipo_red = input("¿Qué red se procesará? (automatica/convencional): ").strip().lower()
-
-# Establecer el locale en español (esto puede variar según el sistema operativo)
-try:
-    locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')  # Linux/Mac
-except:
-    try:
-        locale.setlocale(locale.LC_TIME, 'Spanish_Spain')  # Windows
-    except:
-        print("No se pudo establecer el locale en español.")
-
-fecha_inicio = input("Ingresa fecha inicio (dd/mm/yyyy): ").strip()
-fecha_fin = input("Ingresa fecha fin (dd/mm/yyyy): ").strip()
-
-# Lista de archivos PDF a procesar (puedes poner una carpeta o lista manual)
-ruta_carpeta = "../automaticas_disp"
-pdf_files = glob.glob(os.path.join(ruta_carpeta, "*.pdf"))
-
-# CSV de salida
-# fecha_inicio = '02/10/2025'
-# fecha_fin = '08/10/2025'
-dia_mes_inicio = fecha_inicio[:5].replace('/', '')
-dia_mes_fin = fecha_fin[:5].replace('/', '')
-
-# Creación de los nombres de los archivos resultantes
-csv_disponibilidad = "disponibilidad" + '_' + tipo_red + '_' + dia_mes_inicio + '_' + dia_mes_fin + '.csv'
-csv_fallas = "fallas" + '_' + tipo_red + '_' + dia_mes_inicio + '_' + dia_mes_fin + '.csv'
-
 # --- Patrones ---
 patron_estacion = re.compile(r"Estación:\s+(.+)", re.IGNORECASE)
-patron_disponibilidad = re.compile(r"Tabla de Disponibilidad de Datos", re.IGNORECASE)
-patron_fallas = re.compile(r"Tabla de Fallas en Sensores", re.IGNORECASE)
 patron_dz = re.compile(r"Reporte_DZ_(\d+)\.pdf", re.IGNORECASE)
+patron_espacios = re.compile(r"\s+")
+# Títulos de tabla: texto fijo del reporte, basta una búsqueda de subcadena
+titulo_disponibilidad = "Tabla de Disponibilidad de Datos"
+titulo_fallas = "Tabla de Fallas en Sensores"
 
 # --- Normalización / reparación de texto ---
+# Memoizada: estaciones, variables y sensores se repiten en muchas filas
+@lru_cache(maxsize=4096)
 def fix_text(s):
     if s is None:
         return s
     s = s.strip()
     if not s:
         return s
+    # ASCII puro: no puede tener BOM, mojibake ni formas por normalizar
+    if s.isascii():
+        return patron_espacios.sub(" ", s)
     s = s.replace("\ufeff", "")
     try:
         if "Ã" in s or "Â" in s:
@@ -65,40 +43,71 @@ def fix_text(s):
     except Exception:
         pass
     s = unicodedata.normalize("NFC", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = patron_espacios.sub(" ", s).strip()
     return s
 
-# --- Inicializar estructuras ---
-rows_disponibilidad = []
-rows_fallas = []
+def fix_page_text(text):
+    """Repara el texto completo de una página una sola vez (BOM, mojibake, NFC)"""
+    text = text.replace("\ufeff", "")
+    try:
+        if "Ã" in text or "Â" in text:
+            candidate = text.encode("latin1").decode("utf-8")
+            if sum(1 for c in candidate if ord(c) > 127) >= sum(1 for c in text if ord(c) > 127):
+                text = candidate
+    except Exception:
+        pass
+    return unicodedata.normalize("NFC", text)
 
+# --- Columnas de salida ---
 cols_disponibilidad = ["DZ", "Estacion", "Variable", "Datos_flag_C", "Datos_flag_M", "Datos_flag_SD", "Datos_esperados", "Operatividad"]
 cols_fallas = ["DZ", "Estacion", "Sensor ID", "Nombre del Sensor", "Variables con Falla"]
 
-# --- Procesar PDFs ---
-for pdf_file in pdf_files:
+# Primeras palabras de filas basura dentro de la tabla de disponibilidad
+variables_basura = frozenset({"Variable", "Operatividad", "Sin"})
+
+# --- Procesar un PDF (independiente de los demás: se ejecuta en un proceso hijo) ---
+def process_pdf(pdf_file):
+    """Extrae las filas de disponibilidad y de fallas de un PDF"""
     # extraer número DZ del nombre de archivo
     dz_match = patron_dz.search(os.path.basename(pdf_file))
     dz_value = dz_match.group(1) if dz_match else "NA"
 
+    rows_disponibilidad = []
+    rows_fallas = []
+
     if not os.path.exists(pdf_file):
         print(f"Archivo no encontrado: {pdf_file}")
-        continue
+        return rows_disponibilidad, rows_fallas
 
     with pdfplumber.open(pdf_file) as pdf:
+        # PDF escaneado (primeras páginas solo con imágenes, sin texto): no hay tablas que leer
+        primeras = pdf.pages[:3]
+        if primeras and all(not p.chars and p.images for p in primeras):
+            print(f"PDF escaneado (sin texto), se omite: {pdf_file}")
+            return rows_disponibilidad, rows_fallas
+
         estacion_actual = None
         en_disponibilidad = False
         en_fallas = False
+        # métodos ligados a variables locales: evita la búsqueda de atributo en cada línea
+        est_search = patron_estacion.search
+        append_disp = rows_disponibilidad.append
+        append_fallas = rows_fallas.append
 
         for page in pdf.pages:
-            text = page.extract_text()
+            # páginas solo con gráficos/imágenes: no tienen tablas que leer
+            text = page.extract_text() if len(page.chars) >= 20 else None
+            # liberar los objetos ya parseados de la página (caracteres, curvas, rectángulos)
+            page.close()
             if not text:
                 continue
+            # Reparación de codificación una vez por página; por línea solo espacios
+            text = fix_page_text(text)
             for raw_line in text.split("\n"):
-                line = fix_text(raw_line)
+                line = patron_espacios.sub(" ", raw_line).strip()
 
                 # detectar estación
-                m_est = patron_estacion.search(line)
+                m_est = est_search(line)
                 if m_est:
                     estacion_actual = fix_text(m_est.group(1))
                     en_disponibilidad = False
@@ -106,11 +115,11 @@ for pdf_file in pdf_files:
                     continue
 
                 # detectar inicio de tablas
-                if patron_disponibilidad.search(line):
+                if titulo_disponibilidad in line:
                     en_disponibilidad = True
                     en_fallas = False
                     continue
-                if patron_fallas.search(line):
+                elif titulo_fallas in line:
                     en_disponibilidad = False
                     en_fallas = True
                     continue
@@ -121,11 +130,11 @@ for pdf_file in pdf_files:
                     if len(parts) >= 6:
                         variable = fix_text(parts[0])
                         # filtrar filas basura
-                        if variable in {"Variable", "Operatividad", "Sin"}:
+                        if variable in variables_basura:
                             continue
-                        tail = parts[-5:]
-                        datos_c, datos_m, datos_sd, datos_exp, oper = [fix_text(t) for t in tail]
-                        rows_disponibilidad.append([
+                        # columnas numéricas: ya vienen separadas y sin espacios, no requieren fix_text
+                        datos_c, datos_m, datos_sd, datos_exp, oper = parts[-5:]
+                        append_disp([
                             dz_value,
                             estacion_actual,
                             variable,
@@ -134,12 +143,15 @@ for pdf_file in pdf_files:
 
                 # parsear fallas
                 if en_fallas:
+                    # encabezado de la tabla ("Sensor ID Nombre del Sensor Variables con Falla")
+                    if line.startswith("Sensor ID"):
+                        continue
                     parts = line.split()
                     if len(parts) >= 3:
-                        sensor_id = fix_text(parts[0])
+                        sensor_id = parts[0]
                         variables = fix_text(parts[-1])
                         nombre_sensor = fix_text(" ".join(parts[1:-1])) if len(parts) > 2 else ""
-                        rows_fallas.append([
+                        append_fallas([
                             dz_value,
                             estacion_actual,
                             sensor_id,
@@ -147,17 +159,58 @@ for pdf_file in pdf_files:
                             variables
                         ])
 
-# Guardar CSV con BOM
-with open(csv_disponibilidad, "w", newline="", encoding="utf-8-sig") as f:
-    writer = csv.writer(f)
-    writer.writerow(cols_disponibilidad)
-    writer.writerows(rows_disponibilidad)
+    return rows_disponibilidad, rows_fallas
+
 
-with open(csv_fallas, "w", newline="", encoding="utf-8-sig") as f:
-    writer = csv.writer(f)
-    writer.writerow(cols_fallas)
-    writer.writerows(rows_fallas)
+if __name__ == "__main__":
+    # Preguntar al usuario por el tipo de red
+    tipo_red = ''
+    while tipo_red not in ['automatica', 'convencional']:
+        tipo_red = input("¿Qué red se procesará? (automatica/convencional): ").strip().lower()
 
-print("Extracción completada:")
-print(" -", csv_disponibilidad)
-print(" -", csv_fallas)
+    # Establecer el locale en español (esto puede variar según el sistema operativo)
+    try:
+        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')  # Linux/Mac
+    except:
+        try:
+            locale.setlocale(locale.LC_TIME, 'Spanish_Spain')  # Windows
+        except:
+            print("No se pudo establecer el locale en español.")
+
+    fecha_inicio = input("Ingresa fecha inicio (dd/mm/yyyy): ").strip()
+    fecha_fin = input("Ingresa fecha fin (dd/mm/yyyy): ").strip()
+
+    # Lista de archivos PDF a procesar (puedes poner una carpeta o lista manual)
+    ruta_carpeta = "../automaticas_disp"
+    # Orden fijo (alfabético) para que las filas de los CSV salgan siempre en el mismo orden;
+    # ex.map envía todos los archivos al pool de una vez, así que la lista se arma completa
+    pdf_files = sorted(glob.glob(os.path.join(ruta_carpeta, "*.pdf")))
+
+    # CSV de salida
+    # fecha_inicio = '02/10/2025'
+    # fecha_fin = '08/10/2025'
+    dia_mes_inicio = fecha_inicio[:5].replace('/', '')
+    dia_mes_fin = fecha_fin[:5].replace('/', '')
+
+    # Creación de los nombres de los archivos resultantes
+    csv_disponibilidad = "disponibilidad" + '_' + tipo_red + '_' + dia_mes_inicio + '_' + dia_mes_fin + '.csv'
+    csv_fallas = "fallas" + '_' + tipo_red + '_' + dia_mes_inicio + '_' + dia_mes_fin + '.csv'
+
+    # --- Procesar PDFs en paralelo (un PDF por tarea) ---
+    # Cada proceso devuelve las filas de su PDF y el proceso padre las escribe
+    # a los CSV (con BOM) a medida que llegan, sin acumular todo en memoria
+    with open(csv_disponibilidad, "w", newline="", encoding="utf-8-sig") as f_disp, \
+         open(csv_fallas, "w", newline="", encoding="utf-8-sig") as f_fallas, \
+         ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        writer_disp = csv.writer(f_disp)
+        writer_fallas = csv.writer(f_fallas)
+        writer_disp.writerow(cols_disponibilidad)
+        writer_fallas.writerow(cols_fallas)
+
+        for rows_disp_pdf, rows_fallas_pdf in ex.map(process_pdf, pdf_files):
+            writer_disp.writerows(rows_disp_pdf)
+            writer_fallas.writerows(rows_fallas_pdf)
+
+    print("Extracción completada:")
+    print(" -", csv_disponibilidad)
+    print(" -", csv_fallas)
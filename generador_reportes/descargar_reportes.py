@@ -16,6 +16,7 @@ Uso:
     python descargar_reportes.py --dz 1 5 9        # Descarga solo DZs específicas
     python descargar_reportes.py --dias 30         # Período de 30 días (boletín)
     python descargar_reportes.py --fecha-fin 2025-12-12  # Fecha fin específica
+    python descargar_reportes.py --workers 2       # Dos navegadores en paralelo
 
 Autor: Sistema de Monitoreo Meteorológico - SGR
 Versión: 1.0
@@ -26,6 +27,9 @@ import os
 import sys
 import time
 import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -36,7 +40,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+
+# Aviso de cambios en el directorio de descargas por eventos del sistema (inotify /
+# ReadDirectoryChangesW) si watchdog está instalado; si no, revisión cada segundo
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_DISPONIBLE = True
+except ImportError:
+    WATCHDOG_DISPONIBLE = False
 
 
 # =============================================================================
@@ -55,12 +68,20 @@ TIMEOUT_CARGA_DATOS = 30
 # Tiempo máximo de espera para descarga de PDF (segundos)
 TIMEOUT_GENERACION_REPORTE = 60
 
-# Tiempo de espera entre acciones (segundos) - reducido para mayor velocidad
-DELAY_ENTRE_ACCIONES = 0.5
-
 # Directorio de descarga de PDFs (relativo al script)
 DIRECTORIO_DESCARGAS = Path(__file__).parent / "input_pdfs"
 
+# Navegadores descargando DZs en paralelo (cada uno con su propia sesión de Chrome)
+WORKERS_DESCARGA = 4
+
+# Ejecutar Chrome sin ventana visible (usar --ver-navegador para depurar)
+MODO_HEADLESS = True
+
+# Puerto de depuración remota del primer navegador (el navegador N usa PUERTO + N - 1).
+# Con --mantener-navegador Chrome queda abierto en ese puerto y una ejecución posterior
+# con --reusar-navegador se conecta a él en lugar de iniciar un Chrome nuevo
+PUERTO_DEPURACION_BASE = 9222
+
 # =============================================================================
 # IDs DE ELEMENTOS HTML EN SISMOP (verificados)
 # =============================================================================
@@ -80,6 +101,28 @@ ID_BOTON_CONSULTAR = "update-date-range-button"
 # Botón para generar reporte por DZ
 ID_BOTON_REPORTE = "report-button"
 
+# Calendario desplegable del DatePickerRange de Dash (react-dates) y espera máxima a que
+# se cierre tras confirmar una fecha con Enter (segundos)
+SELECTOR_CALENDARIO = ".DateRangePicker_picker"
+TIMEOUT_CIERRE_CALENDARIO = 3
+
+# Escribir ambas fechas del DatePickerRange con una sola llamada de JavaScript
+# (False: escribirlas con el teclado campo por campo, como un usuario)
+FECHAS_POR_JS = True
+
+# Espera máxima a que los inputs muestren las fechas escritas por JavaScript antes de
+# volver a escribirlas con el teclado (segundos)
+TIMEOUT_VERIFICAR_FECHAS = 3
+
+# Opciones de los dropdowns de Dash (react-select virtualizado, clásico o por rol ARIA)
+SELECTOR_OPCIONES_DROPDOWN = ".VirtualizedSelectOption, .Select-option, [role='option']"
+
+# Elementos ya localizados por ID, por sesión de navegador: (session_id, id) -> WebElement
+# Los contenedores y botones persisten entre DZs; se vuelven a buscar solo si quedan obsoletos
+# Los navegadores en paralelo (un hilo cada uno) comparten el dict: todo acceso va con el lock
+_ELEMENTOS_CACHE = {}
+_ELEMENTOS_CACHE_LOCK = threading.Lock()
+
 
 # =============================================================================
 # FUNCIONES AUXILIARES
@@ -118,12 +161,21 @@ def calcular_rango_fechas(fecha_fin: datetime = None, dias: int = 7) -> tuple:
     return fecha_inicio, fecha_fin_sismop
 
 
-def configurar_chrome(directorio_descargas: Path) -> webdriver.Chrome:
+def configurar_chrome(
+    directorio_descargas: Path,
+    headless: bool = MODO_HEADLESS,
+    modo_sesion: str = "nueva",
+    puerto_depuracion: int = PUERTO_DEPURACION_BASE
+) -> webdriver.Chrome:
     """
     Configura y retorna una instancia de Chrome WebDriver.
 
     Args:
         directorio_descargas: Directorio donde se guardarán los PDFs
+        headless: True para ejecutar Chrome sin ventana visible
+        modo_sesion: "nueva" (Chrome nuevo que se cierra al terminar), "mantener" (Chrome nuevo
+            que queda abierto en puerto_depuracion) o "reusar" (conectarse al Chrome abierto ahí)
+        puerto_depuracion: Puerto de depuración remota para "mantener" y "reusar"
 
     Returns:
         webdriver.Chrome: Instancia configurada del navegador
@@ -134,6 +186,18 @@ def configurar_chrome(directorio_descargas: Path) -> webdriver.Chrome:
     # Configurar opciones de Chrome
     chrome_options = Options()
 
+    if modo_sesion == "reusar":
+        # Conectarse al Chrome ya abierto: sin arranque ni inicialización de perfil
+        # (sus opciones son las de la ejecución que lo dejó abierto)
+        chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{puerto_depuracion}")
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.implicitly_wait(0)
+        driver.execute_cdp_cmd("Page.setDownloadBehavior", {
+            "behavior": "allow",
+            "downloadPath": str(directorio_descargas.absolute())
+        })
+        return driver
+
     # Configurar directorio de descargas
     prefs = {
         "download.default_directory": str(directorio_descargas.absolute()),
@@ -154,12 +218,29 @@ def configurar_chrome(directorio_descargas: Path) -> webdriver.Chrome:
     chrome_options.add_argument("--disable-web-security")  # Permitir descargas HTTP
     chrome_options.add_argument("--allow-running-insecure-content")  # Permitir contenido HTTP
 
-    # Descomentar para modo headless (sin ventana visible)
-    # chrome_options.add_argument("--headless")
+    # Modo headless (sin ventana visible) y sin trabajo de render innecesario:
+    # SISMOP se maneja por el DOM, las imágenes no hacen falta para generar el reporte
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-features=TranslateUI")
+
+    if modo_sesion == "mantener":
+        # Chrome con depuración remota y perfil propio, que sigue abierto al terminar el script
+        perfil = Path(tempfile.gettempdir()) / f"sismop_chrome_{puerto_depuracion}"
+        chrome_options.add_argument(f"--remote-debugging-port={puerto_depuracion}")
+        chrome_options.add_argument(f"--user-data-dir={perfil}")
+        chrome_options.add_experimental_option("detach", True)
 
     # Crear instancia del navegador
     driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
+    # Sin espera implícita: todas las esperas son explícitas (WebDriverWait). Con espera
+    # implícita cada búsqueda fallida (botón de diálogo, clear del dropdown, etc.) se
+    # bloquea hasta agotarla antes de pasar a la siguiente alternativa
+    driver.implicitly_wait(0)
 
     # Usar Chrome DevTools Protocol para permitir descargas sin confirmación
     # Esto evita el diálogo "Se bloqueó una descarga no segura"
@@ -171,6 +252,23 @@ def configurar_chrome(directorio_descargas: Path) -> webdriver.Chrome:
     return driver
 
 
+def cerrar_chrome(driver, modo_sesion: str = "nueva"):
+    """
+    Cierra la sesión de WebDriver.
+
+    En los modos "mantener" y "reusar" solo se detiene chromedriver y Chrome sigue
+    abierto para la siguiente ejecución con --reusar-navegador.
+
+    Args:
+        driver: Instancia de WebDriver
+        modo_sesion: Modo con el que se configuró el navegador
+    """
+    if modo_sesion == "nueva":
+        driver.quit()
+    else:
+        driver.service.stop()
+
+
 def manejar_dialogo_descarga(driver, timeout: int = 5):
     """
     Intenta manejar el diálogo de descarga de Chrome que aparece para sitios HTTP.
@@ -197,8 +295,10 @@ def manejar_dialogo_descarga(driver, timeout: int = 5):
 
         for xpath in botones_conservar:
             try:
-                boton = driver.find_element(By.XPATH, xpath)
-                if boton.is_displayed():
+                # find_elements: lista vacía si no existe, sin lanzar ni esperar
+                botones = driver.find_elements(By.XPATH, xpath)
+                boton = botones[0] if botones else None
+                if boton is not None and boton.is_displayed():
                     boton.click()
                     time.sleep(1)
                     return True
@@ -218,6 +318,46 @@ def manejar_dialogo_descarga(driver, timeout: int = 5):
     return False
 
 
+if WATCHDOG_DISPONIBLE:
+    class AvisoPdf(FileSystemEventHandler):
+        """Activa un threading.Event cuando se crea, modifica o renombra un .pdf."""
+
+        def __init__(self, aviso: threading.Event):
+            super().__init__()
+            self.aviso = aviso
+
+        def on_any_event(self, event):
+            # Chrome descarga a .crdownload y al terminar lo renombra a .pdf (dest_path)
+            ruta = getattr(event, "dest_path", "") or event.src_path
+            if str(ruta).endswith(".pdf"):
+                self.aviso.set()
+
+
+def vigilar_pdfs(directorio: Path, aviso: threading.Event):
+    """
+    Inicia un observador de watchdog que activa aviso al aparecer PDFs en directorio.
+
+    Args:
+        directorio: Directorio de descargas
+        aviso: Evento a activar
+
+    Returns:
+        Observer iniciado, o None si watchdog no está instalado
+    """
+    if not WATCHDOG_DISPONIBLE:
+        return None
+    observador = Observer()
+    observador.schedule(AvisoPdf(aviso), str(directorio))
+    observador.start()
+    return observador
+
+
+def esperar_aviso(aviso: threading.Event, timeout: float = 1):
+    """Espera el aviso de un PDF nuevo (o timeout segundos, como la revisión periódica) y lo rearma."""
+    aviso.wait(timeout)
+    aviso.clear()
+
+
 def esperar_descarga_completa(directorio: Path, timeout: int = 60, driver=None, dias: int = 7, pdfs_antes: set = None) -> bool:
     """
     Espera hasta que se complete la descarga del archivo PDF.
@@ -240,62 +380,128 @@ def esperar_descarga_completa(directorio: Path, timeout: int = 60, driver=None,
 
     # Si no se pasó lista de PDFs anteriores, obtenerla ahora
     if pdfs_antes is None:
-        pdfs_antes = set(p.name for p in directorio.glob("*.pdf"))
+        pdfs_antes = obtener_pdfs_existentes(directorio)
 
     tiempo_inicio = time.time()
     intentos_dialogo = 0
     ultimo_log = 0
 
-    while time.time() - tiempo_inicio < timeout:
-        transcurrido = time.time() - tiempo_inicio
-
-        # Intentar manejar el diálogo de descarga
-        if driver and intentos_dialogo < 3:
-            manejar_dialogo_descarga(driver)
-            intentos_dialogo += 1
-
-        # Buscar archivos .crdownload (descargas en progreso)
-        descargas_en_progreso = list(directorio.glob("*.crdownload"))
-        if descargas_en_progreso:
-            if transcurrido - ultimo_log > 10:
-                print(f"  [    ] Descarga en progreso... ({transcurrido:.0f}s)")
-                ultimo_log = transcurrido
-            time.sleep(1)
-            continue
-
-        # Buscar nuevos PDFs (que no estaban antes)
-        pdfs_actuales = set(p.name for p in directorio.glob("*.pdf"))
-        nuevos_pdfs = pdfs_actuales - pdfs_antes
-
-        if nuevos_pdfs:
-            # Verificar que el PDF tenga contenido
-            for nombre_pdf in nuevos_pdfs:
-                pdf_path = directorio / nombre_pdf
-                try:
-                    if pdf_path.stat().st_size > 1000:
-                        print(f"  [    ] PDF detectado: {nombre_pdf} ({transcurrido:.1f}s)")
-                        return True
-                except:
-                    pass
-
-        time.sleep(1)
+    # Entre revisiones se espera un aviso de PDF nuevo (o a lo más 1 segundo)
+    aviso_pdf = threading.Event()
+    observador = vigilar_pdfs(directorio, aviso_pdf)
+
+    try:
+        while time.time() - tiempo_inicio < timeout:
+            transcurrido = time.time() - tiempo_inicio
+
+            # Intentar manejar el diálogo de descarga
+            if driver and intentos_dialogo < 3:
+                manejar_dialogo_descarga(driver)
+                intentos_dialogo += 1
+
+            # Buscar archivos .crdownload (descargas en progreso)
+            descargas_en_progreso = listar_archivos(directorio, ".crdownload")
+            if descargas_en_progreso:
+                if transcurrido - ultimo_log > 10:
+                    print(f"  [    ] Descarga en progreso... ({transcurrido:.0f}s)")
+                    ultimo_log = transcurrido
+                esperar_aviso(aviso_pdf)
+                continue
+
+            # Buscar nuevos PDFs (que no estaban antes)
+            pdfs_actuales = obtener_pdfs_existentes(directorio)
+            nuevos_pdfs = pdfs_actuales - pdfs_antes
+
+            if nuevos_pdfs:
+                # Verificar que el PDF tenga contenido
+                for nombre_pdf in nuevos_pdfs:
+                    pdf_path = directorio / nombre_pdf
+                    try:
+                        if pdf_path.stat().st_size > 1000:
+                            print(f"  [    ] PDF detectado: {nombre_pdf} ({transcurrido:.1f}s)")
+                            return True
+                    except:
+                        pass
+
+            esperar_aviso(aviso_pdf)
+    finally:
+        if observador is not None:
+            observador.stop()
+            observador.join()
 
     # Timeout - mostrar diagnóstico
     print(f"  [DEBUG] Timeout después de {timeout}s")
     print(f"  [DEBUG] PDFs antes: {pdfs_antes}")
-    print(f"  [DEBUG] PDFs ahora: {set(p.name for p in directorio.glob('*.pdf'))}")
+    print(f"  [DEBUG] PDFs ahora: {obtener_pdfs_existentes(directorio)}")
     return False
 
 
 def obtener_pdfs_existentes(directorio: Path) -> set:
     """Obtiene el set de nombres de PDFs existentes en el directorio."""
-    return set(p.name for p in directorio.glob("*.pdf"))
+    return {entrada.name for entrada in listar_archivos(directorio, ".pdf")}
+
+
+def listar_archivos(directorio: Path, extension: str) -> list:
+    """
+    Lista los archivos del directorio con la extensión dada (sin distinguir mayúsculas).
+
+    Usa os.scandir: el nombre viene de la propia entrada del directorio, sin crear un
+    Path por archivo, y stat() solo se consulta para las entradas que lo necesiten.
+
+    Args:
+        directorio: Directorio a revisar
+        extension: Extensión con punto, en minúsculas (ej: ".pdf")
+
+    Returns:
+        list: Entradas os.DirEntry de los archivos encontrados
+    """
+    with os.scandir(directorio) as entradas:
+        return [e for e in entradas if e.name.lower().endswith(extension) and e.is_file()]
 
 
 # =============================================================================
 # FUNCIONES DE INTERACCIÓN CON SISMOP
 # =============================================================================
 
+def buscar_por_id(driver, elemento_id: str, timeout: int = 10, usar_cache: bool = True):
+    """
+    Localiza un elemento por su ID, reutilizando el ya localizado en esta sesión.
+
+    El elemento en caché no se valida aquí: si quedó obsoleto, el primer uso lanza
+    StaleElementReferenceException y el llamador lo vuelve a buscar con usar_cache=False.
+
+    Args:
+        driver: Instancia de WebDriver
+        elemento_id: ID del elemento
+        timeout: Tiempo máximo de espera
+        usar_cache: False para forzar una nueva búsqueda
+
+    Returns:
+        WebElement: Elemento localizado
+    """
+    clave = (driver.session_id, elemento_id)
+    if usar_cache:
+        with _ELEMENTOS_CACHE_LOCK:
+            elemento = _ELEMENTOS_CACHE.get(clave)
+        if elemento is not None:
+            return elemento
+
+    # La espera va fuera del lock para no bloquear a los otros navegadores
+    elemento = WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.ID, elemento_id))
+    )
+    with _ELEMENTOS_CACHE_LOCK:
+        _ELEMENTOS_CACHE[clave] = elemento
+    return elemento
+
+
+def limpiar_cache_elementos(driver):
+    """Descarta los elementos en caché de la sesión (llamar tras navegar a otra página)."""
+    with _ELEMENTOS_CACHE_LOCK:
+        for clave in [c for c in list(_ELEMENTOS_CACHE) if c[0] == driver.session_id]:
+            del _ELEMENTOS_CACHE[clave]
+
+
 def seleccionar_dropdown_dash(driver, dropdown_id: str, valor: str, timeout: int = 10):
     """
     Selecciona un valor en un dropdown searchable de Dash (dcc.Dropdown).
@@ -309,34 +515,44 @@ def seleccionar_dropdown_dash(driver, dropdown_id: str, valor: str, timeout: int
     wait = WebDriverWait(driver, timeout)
 
     # Localizar el contenedor del dropdown por ID
-    dropdown_container = wait.until(
-        EC.presence_of_element_located((By.ID, dropdown_id))
-    )
+    dropdown_container = buscar_por_id(driver, dropdown_id, timeout)
+
+    # Localizar botón de limpiar, control e input en una sola llamada al navegador
+    # (null si no existen; los clicks se hacen con Selenium para generar eventos reales)
+    js_partes = """
+    var c = arguments[0];
+    return [
+        c.querySelector('.Select-clear'),
+        c.querySelector('.Select-control'),
+        c.querySelector("input[role='combobox']") || c.querySelector('input')
+    ];
+    """
+    try:
+        partes = driver.execute_script(js_partes, dropdown_container)
+    except StaleElementReferenceException:
+        # El contenedor en caché se volvió a renderizar: buscarlo de nuevo
+        dropdown_container = buscar_por_id(driver, dropdown_id, timeout, usar_cache=False)
+        partes = driver.execute_script(js_partes, dropdown_container)
+    clear_button, select_control, dropdown_input = partes
+    if dropdown_input is None:
+        raise NoSuchElementException(f"No se encontró el input del dropdown '{dropdown_id}'")
 
     # Limpiar selección existente
-    try:
-        clear_button = dropdown_container.find_element(By.CLASS_NAME, "Select-clear")
+    if clear_button is not None:
         clear_button.click()
-    except NoSuchElementException:
-        pass
 
     # Click para abrir el dropdown
-    try:
-        select_control = dropdown_container.find_element(By.CLASS_NAME, "Select-control")
-        select_control.click()
-    except NoSuchElementException:
-        dropdown_container.click()
-
-    # Buscar el input
-    try:
-        dropdown_input = dropdown_container.find_element(By.CSS_SELECTOR, "input[role='combobox']")
-    except NoSuchElementException:
-        dropdown_input = dropdown_container.find_element(By.TAG_NAME, "input")
+    (select_control or dropdown_container).click()
 
     # Escribir el valor para filtrar
     dropdown_input.send_keys(Keys.CONTROL + "a")
     dropdown_input.send_keys(valor)
-    time.sleep(0.5)
+
+    # Esperar a que el menú muestre opciones (en lugar de una pausa fija)
+    try:
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_OPCIONES_DROPDOWN)))
+    except TimeoutException:
+        pass
 
     # Buscar opción exacta usando JavaScript (más confiable con virtualización)
     js_click = """
@@ -352,25 +568,40 @@ def seleccionar_dropdown_dash(driver, dropdown_id: str, valor: str, timeout: int
 
     encontrado = driver.execute_script(js_click, valor)
     if encontrado:
+        esperar_cierre_menu(wait)
         return
 
-    # Si no encontramos con JS, intentar con Selenium
-    selectores = [".VirtualizedSelectOption", ".Select-option"]
-    for selector in selectores:
-        try:
-            opciones = driver.find_elements(By.CSS_SELECTOR, selector)
-            for opcion in opciones:
-                if opcion.text.strip() == valor:
-                    opcion.click()
-                    return
-        except:
-            pass
+    # Si no encontramos con JS, intentar con Selenium comparando el texto visible
+    # (un solo selector CSS para todas las variantes de opción, y los textos de todas
+    # las opciones se leen en una sola llamada, no uno por opción)
+    try:
+        opciones = driver.find_elements(By.CSS_SELECTOR, SELECTOR_OPCIONES_DROPDOWN)
+        textos = driver.execute_script("return arguments[0].map(function (o) { return o.innerText.trim(); });", opciones)
+        if valor in textos:
+            opciones[textos.index(valor)].click()
+            esperar_cierre_menu(wait)
+            return
+    except:
+        pass
 
     # Fallback: cerrar dropdown con Escape y reportar
     dropdown_input.send_keys(Keys.ESCAPE)
     print(f"  [ADVERTENCIA] No se encontró '{valor}' - verificar manualmente")
 
 
+def esperar_cierre_menu(wait: WebDriverWait):
+    """
+    Espera a que se cierre el menú de opciones de un dropdown de Dash tras elegir una opción.
+
+    Args:
+        wait: WebDriverWait del driver en uso
+    """
+    try:
+        wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, ".Select-menu-outer")))
+    except TimeoutException:
+        pass
+
+
 def seleccionar_primera_opcion_dropdown(driver, dropdown_id: str, timeout: int = 10):
     """
     Selecciona la primera opción disponible en un dropdown.
@@ -389,15 +620,15 @@ def seleccionar_primera_opcion_dropdown(driver, dropdown_id: str, timeout: int =
     )
 
     # Click para abrir el dropdown
-    try:
-        select_control = dropdown_container.find_element(By.CLASS_NAME, "Select-control")
-        select_control.click()
-    except NoSuchElementException:
-        dropdown_container.click()
+    select_control = dropdown_container.find_elements(By.CLASS_NAME, "Select-control")
+    (select_control[0] if select_control else dropdown_container).click()
 
     # Flecha abajo + Enter para seleccionar primera opción
+    # (espera explícita al input: sin espera implícita puede no estar renderizado aún)
     try:
-        dropdown_input = dropdown_container.find_element(By.CSS_SELECTOR, "input[role='combobox']")
+        dropdown_input = wait.until(
+            lambda d: (dropdown_container.find_elements(By.CSS_SELECTOR, "input[role='combobox']") or [None])[0]
+        )
         dropdown_input.send_keys(Keys.ARROW_DOWN)
         dropdown_input.send_keys(Keys.ENTER)
     except:
@@ -427,11 +658,9 @@ def seleccionar_fecha_dash(driver, placeholder: str, fecha: datetime, timeout: i
 
     # Hacer click para activar el input
     date_input.click()
-    time.sleep(0.3)
 
     # Limpiar el campo (seleccionar todo y borrar)
     date_input.send_keys(Keys.CONTROL + "a")
-    time.sleep(0.1)
 
     # Escribir la fecha en formato dd/mm/yyyy
     fecha_str = fecha.strftime("%d/%m/%Y")
@@ -439,7 +668,69 @@ def seleccionar_fecha_dash(driver, placeholder: str, fecha: datetime, timeout: i
 
     # Presionar Enter para confirmar y cerrar el calendario
     date_input.send_keys(Keys.ENTER)
-    time.sleep(DELAY_ENTRE_ACCIONES)
+
+    # Esperar a que react-dates procese el Enter: el calendario se cierra al aceptar la fecha.
+    # El value del input no sirve de señal (ya tiene el texto escrito antes del Enter).
+    # Si no se cierra a tiempo se continúa, como con la pausa fija anterior
+    try:
+        WebDriverWait(driver, TIMEOUT_CIERRE_CALENDARIO).until(
+            lambda d: not any(c.is_displayed() for c in d.find_elements(By.CSS_SELECTOR, SELECTOR_CALENDARIO))
+        )
+    except (TimeoutException, StaleElementReferenceException):
+        pass
+
+
+def configurar_fechas_dash(driver, fecha_inicio: datetime, fecha_fin: datetime, timeout: int = 10):
+    """
+    Escribe las fechas de inicio y fin del DatePickerRange de Dash en una sola llamada.
+
+    Usa el setter nativo de value y dispara los eventos input/change para que React
+    registre el cambio (los inputs son componentes controlados). React repone el value
+    anterior de un input controlado si ignora el evento, así que se verifica que ambos
+    inputs muestren las fechas enviadas. Si algún input no se encuentra, la verificación
+    falla o FECHAS_POR_JS es False, usa seleccionar_fecha_dash para cada fecha.
+
+    Args:
+        driver: Instancia de WebDriver
+        fecha_inicio: Fecha para el input "Start Date"
+        fecha_fin: Fecha para el input "End Date"
+        timeout: Tiempo máximo de espera
+    """
+    if FECHAS_POR_JS:
+        js_fechas = """
+        var setter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+        var campos = [['Start Date', arguments[0]], ['End Date', arguments[1]]];
+        var inputs = campos.map(function (c) {
+            return document.querySelector("input[placeholder='" + c[0] + "']");
+        });
+        if (inputs.indexOf(null) !== -1) {
+            return false;
+        }
+        for (var i = 0; i < inputs.length; i++) {
+            setter.call(inputs[i], campos[i][1]);
+            inputs[i].dispatchEvent(new Event('input', {bubbles: true}));
+            inputs[i].dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return true;
+        """
+        valores = (fecha_inicio.strftime("%d/%m/%Y"), fecha_fin.strftime("%d/%m/%Y"))
+        js_valores = """
+        return ['Start Date', 'End Date'].map(function (p) {
+            var input = document.querySelector("input[placeholder='" + p + "']");
+            return input ? input.value : null;
+        });
+        """
+        if driver.execute_script(js_fechas, *valores):
+            try:
+                WebDriverWait(driver, TIMEOUT_VERIFICAR_FECHAS).until(
+                    lambda d: tuple(d.execute_script(js_valores)) == valores
+                )
+                return
+            except TimeoutException:
+                print("  [    ] Las fechas no se aplicaron por JavaScript, se escriben con el teclado...")
+
+    seleccionar_fecha_dash(driver, "Start Date", fecha_inicio, timeout)
+    seleccionar_fecha_dash(driver, "End Date", fecha_fin, timeout)
 
 
 def hacer_click_boton(driver, boton_texto: str = None, boton_id: str = None, timeout: int = 10):
@@ -457,9 +748,7 @@ def hacer_click_boton(driver, boton_texto: str = None, boton_id: str = None, tim
     wait = WebDriverWait(driver, timeout)
 
     if boton_id:
-        boton = wait.until(
-            EC.presence_of_element_located((By.ID, boton_id))
-        )
+        boton = buscar_por_id(driver, boton_id, timeout)
     elif boton_texto:
         # Buscar en cualquier elemento que contenga el texto
         xpath = f"//*[contains(text(), '{boton_texto}')]"
@@ -476,18 +765,76 @@ def hacer_click_boton(driver, boton_texto: str = None, boton_id: str = None, tim
         raise ValueError("Debe especificar boton_texto o boton_id")
 
     # Scroll hasta el elemento para asegurar que esté visible
-    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", boton)
-    time.sleep(0.5)
-
-    # Intentar click normal primero
+    js_scroll = "arguments[0].scrollIntoView({block: 'center'});"
     try:
-        wait.until(EC.element_to_be_clickable((By.ID, boton_id) if boton_id else (By.XPATH, xpath)))
+        driver.execute_script(js_scroll, boton)
+    except StaleElementReferenceException:
+        if not boton_id:
+            raise
+        # El botón en caché se volvió a renderizar: buscarlo de nuevo
+        boton = buscar_por_id(driver, boton_id, timeout, usar_cache=False)
+        driver.execute_script(js_scroll, boton)
+
+    # Intentar click normal primero (la espera de clickeable cubre el scroll)
+    try:
+        wait.until(EC.element_to_be_clickable(boton))
         boton.click()
     except:
         # Si falla, usar JavaScript click como fallback
         driver.execute_script("arguments[0].click();", boton)
 
-    time.sleep(DELAY_ENTRE_ACCIONES)
+
+def obtener_fila_tabla(driver) -> tuple:
+    """
+    Toma una fila con datos de la tabla mostrada (para detectar después su reemplazo).
+
+    Args:
+        driver: Instancia de WebDriver
+
+    Returns:
+        tuple: (fila, texto) de la primera fila con celdas, o (None, None) si no hay tabla
+    """
+    filas = driver.find_elements(By.XPATH, "//table//tr[td]")
+    if not filas:
+        return None, None
+    try:
+        return filas[0], filas[0].text
+    except StaleElementReferenceException:
+        return None, None
+
+
+def esperar_cambio_tabla(driver, fila, texto: str, timeout: int = TIMEOUT_CARGA_DATOS) -> bool:
+    """
+    Espera a que la tabla deje de mostrar los datos anteriores.
+
+    La fila tomada antes de cambiar la DZ debe quedar obsoleta (staleness_of) o, si Dash
+    reutiliza el elemento, cambiar de contenido. Sin esto, esperar_carga_datos encontraría
+    la tabla de la DZ anterior y daría los datos por cargados de inmediato.
+
+    Args:
+        driver: Instancia de WebDriver
+        fila: Fila tomada con obtener_fila_tabla (None = no había tabla, no se espera)
+        texto: Texto de esa fila al tomarla
+        timeout: Tiempo máximo de espera
+
+    Returns:
+        bool: True si la tabla cambió (o no había tabla previa)
+    """
+    if fila is None:
+        return True
+
+    def tabla_actualizada(d):
+        try:
+            return EC.staleness_of(fila)(d) or fila.text != texto
+        except StaleElementReferenceException:
+            return True
+
+    try:
+        WebDriverWait(driver, timeout).until(tabla_actualizada)
+        return True
+    except TimeoutException:
+        print(f"  [ADVERTENCIA] La tabla no cambió tras seleccionar la DZ ({timeout}s)")
+        return False
 
 
 def esperar_carga_datos(driver, timeout: int = 30, dias: int = 7):
@@ -539,22 +886,214 @@ def esperar_carga_datos(driver, timeout: int = 30, dias: int = 7):
 # FUNCIÓN PRINCIPAL DE DESCARGA
 # =============================================================================
 
+def abrir_sismop(driver, tipo_red: str):
+    """
+    Navega a SISMOP y selecciona el tipo de red en la página inicial.
+
+    Args:
+        driver: Instancia de WebDriver
+        tipo_red: Tipo de red a consultar ("automaticas" o "convencionales")
+    """
+    # Navegar a SISMOP - Página principal
+    print(f"[INFO] Navegando a {SISMOP_URL}...")
+    driver.get(SISMOP_URL)
+    limpiar_cache_elementos(driver)
+    time.sleep(3)
+
+    # Seleccionar tipo de red en la página inicial
+    boton_tipo = "Automáticas" if tipo_red == "automaticas" else "Convencionales"
+    print(f"[INFO] Seleccionando '{boton_tipo}'...")
+    hacer_click_boton(driver, boton_texto=boton_tipo)
+    time.sleep(3)  # Esperar a que cargue la página
+
+
+def descargar_reporte_dz(
+    driver,
+    dz_num: int,
+    fecha_inicio: datetime,
+    fecha_fin_sismop: datetime,
+    dias: int,
+    directorio_descarga: Path,
+    directorio_salida: Path
+) -> bool:
+    """
+    Configura el formulario de SISMOP para una DZ y descarga su reporte PDF.
+
+    Args:
+        driver: Instancia de WebDriver (ya en la página del tipo de red)
+        dz_num: Número de la DZ
+        fecha_inicio: Fecha de inicio del período
+        fecha_fin_sismop: Fecha fin seleccionada en SISMOP (fecha fin + 1 día)
+        dias: Número de días del período (7 o 30)
+        directorio_descarga: Directorio de descarga del navegador
+        directorio_salida: Directorio donde queda el PDF renombrado
+
+    Returns:
+        bool: True si el reporte se descargó correctamente
+    """
+    # Fila de la tabla actual (DZ anterior del lote) para esperar a que se reemplace
+    fila_anterior, texto_anterior = obtener_fila_tabla(driver)
+
+    # 1. Seleccionar la DZ
+    print(f"  [1/5] Seleccionando DZ {dz_num}...")
+    seleccionar_dropdown_dash(driver, ID_DROPDOWN_DZ, f"DZ {dz_num}")
+    time.sleep(1)  # Esperar a que se actualice el dropdown de estaciones
+
+    # 2. Seleccionar una estación (la primera disponible)
+    # Esto es necesario para que carguen los datos
+    print(f"  [2/5] Seleccionando primera estación disponible...")
+    seleccionar_primera_opcion_dropdown(driver, ID_DROPDOWN_ESTACION)
+
+    # 3-4. Configurar fechas de inicio y fin (inputs "Start Date" y "End Date")
+    print(f"  [3/5] Configurando fecha inicio: {fecha_inicio.strftime('%d/%m/%Y')}...")
+    print(f"  [4/5] Configurando fecha fin: {fecha_fin_sismop.strftime('%d/%m/%Y')}...")
+    configurar_fechas_dash(driver, fecha_inicio, fecha_fin_sismop)
+
+    # Los datos cargan automáticamente al seleccionar las fechas
+    # Esperar a que se reemplace la tabla anterior y luego la carga de datos
+    print("  [    ] Esperando carga de datos...")
+    esperar_cambio_tabla(driver, fila_anterior, texto_anterior)
+    if not esperar_carga_datos(driver):
+        print(f"  [ERROR] No se pudieron cargar los datos para DZ {dz_num}")
+        return False
+
+    # 5. Generar y descargar reporte
+    print("  [5/5] Generando reporte PDF...")
+
+    # Obtener lista de PDFs ANTES de descargar para detectar el nuevo
+    pdfs_antes = obtener_pdfs_existentes(directorio_descarga)
+
+    hacer_click_boton(driver, boton_id=ID_BOTON_REPORTE)
+
+    # Esperar descarga (comparando con PDFs anteriores)
+    print(f"  [    ] Esperando descarga del PDF...")
+    if not esperar_descarga_completa(directorio_descarga, TIMEOUT_GENERACION_REPORTE, driver, dias, pdfs_antes):
+        print(f"  [ERROR] Timeout en descarga para DZ {dz_num}")
+        return False
+
+    print(f"  [OK] Reporte DZ {dz_num} descargado correctamente")
+
+    # Renombrar el archivo descargado con formato estándar
+    renombrar_ultimo_pdf(directorio_descarga, dz_num, fecha_inicio, fecha_fin_sismop - timedelta(days=1),
+                         directorio_destino=directorio_salida)
+    return True
+
+
+def descargar_lote_dzs(
+    lote: list,
+    num_navegador: int,
+    fecha_inicio: datetime,
+    fecha_fin_sismop: datetime,
+    dias: int,
+    directorio_salida: Path,
+    tipo_red: str,
+    headless: bool = MODO_HEADLESS,
+    modo_sesion: str = "nueva"
+) -> tuple:
+    """
+    Descarga en secuencia un lote de DZs con una sesión propia de Chrome.
+
+    Se ejecuta en un hilo por navegador. Cada navegador descarga en su propia
+    subcarpeta, de modo que el PDF más reciente de esa carpeta siempre es el
+    de la DZ en proceso aunque otros navegadores estén descargando a la vez.
+
+    Args:
+        lote: Números de DZ a descargar con este navegador
+        num_navegador: Número del navegador (para la subcarpeta y los mensajes)
+        fecha_inicio: Fecha de inicio del período
+        fecha_fin_sismop: Fecha fin seleccionada en SISMOP (fecha fin + 1 día)
+        dias: Número de días del período (7 o 30)
+        directorio_salida: Directorio donde guardar los PDFs
+        tipo_red: Tipo de red a consultar ("automaticas" o "convencionales")
+        headless: True para ejecutar Chrome sin ventana visible
+        modo_sesion: "nueva", "mantener" o "reusar" (ver configurar_chrome)
+
+    Returns:
+        tuple: (reportes_descargados, reportes_fallidos)
+    """
+    directorio_descarga = directorio_salida / f".descarga_{num_navegador}"
+
+    # Inicializar el navegador
+    # Si no arranca (o no hay Chrome al que conectarse con --reusar-navegador), las DZs del
+    # lote se cuentan como fallidas y los demás navegadores siguen y se reportan normalmente
+    print(f"\n[INFO] Iniciando navegador Chrome {num_navegador}...")
+    try:
+        driver = configurar_chrome(directorio_descarga, headless, modo_sesion,
+                                   PUERTO_DEPURACION_BASE + num_navegador - 1)
+    except Exception as e:
+        print(f"[ERROR] No se pudo iniciar el navegador {num_navegador} (DZs {lote}): {str(e)}")
+        try:
+            directorio_descarga.rmdir()
+        except OSError:
+            pass
+        return [], list(lote)
+
+    reportes_descargados = []
+    reportes_fallidos = []
+
+    try:
+        try:
+            abrir_sismop(driver, tipo_red)
+        except Exception as e:
+            # Sin la página inicial no se puede procesar ninguna DZ del lote
+            print(f"[ERROR] No se pudo abrir SISMOP en el navegador {num_navegador} (DZs {lote}): {str(e)}")
+            return [], list(lote)
+
+        # Procesar cada DZ del lote
+        for dz_num in lote:
+            print(f"\n[DZ {dz_num}] Procesando Dirección Zonal {dz_num}...")
+
+            try:
+                if descargar_reporte_dz(driver, dz_num, fecha_inicio, fecha_fin_sismop, dias,
+                                        directorio_descarga, directorio_salida):
+                    reportes_descargados.append(dz_num)
+                else:
+                    reportes_fallidos.append(dz_num)
+
+            except Exception as e:
+                print(f"  [ERROR] Error procesando DZ {dz_num}: {str(e)}")
+                reportes_fallidos.append(dz_num)
+                continue
+
+    finally:
+        # Cerrar navegador
+        print(f"\n[INFO] Cerrando navegador {num_navegador}...")
+        limpiar_cache_elementos(driver)
+        cerrar_chrome(driver, modo_sesion)
+
+        # Quitar la subcarpeta de descarga si quedó vacía
+        try:
+            directorio_descarga.rmdir()
+        except OSError:
+            pass
+
+    return reportes_descargados, reportes_fallidos
+
+
 def descargar_reportes_dz(
     dzs: list = None,
     fecha_fin: datetime = None,
     dias: int = 7,
     directorio_salida: Path = None,
-    tipo_red: str = "automaticas"
+    tipo_red: str = "automaticas",
+    workers: int = WORKERS_DESCARGA,
+    headless: bool = MODO_HEADLESS,
+    modo_sesion: str = "nueva"
 ):
     """
     Descarga los reportes PDF de las Direcciones Zonales especificadas.
 
+    Las DZs se reparten entre varios navegadores que descargan en paralelo.
+
     Args:
         dzs: Lista de números de DZ a descargar (None = todas, 1-13)
         fecha_fin: Fecha final del período
         dias: Número de días del período (7 o 30)
         directorio_salida: Directorio donde guardar los PDFs
         tipo_red: Tipo de red a consultar ("automaticas" o "convencionales")
+        workers: Número de navegadores en paralelo (1 = descarga secuencial)
+        headless: True para ejecutar Chrome sin ventana visible
+        modo_sesion: "nueva", "mantener" o "reusar" (ver configurar_chrome)
     """
     # Configurar lista de DZs
     if dzs is None:
@@ -575,87 +1114,31 @@ def descargar_reportes_dz(
     print(f"Fechas en SISMOP: {fecha_inicio.strftime('%d/%m/%Y')} - {fecha_fin_sismop.strftime('%d/%m/%Y')}")
     print(f"DZs a descargar: {dzs}")
     print(f"Directorio de salida: {directorio_salida}")
-    print("=" * 60)
 
-    # Inicializar el navegador
-    print("\n[INFO] Iniciando navegador Chrome...")
-    driver = configurar_chrome(directorio_salida)
+    # Repartir las DZs entre los navegadores (a lo más uno por DZ)
+    workers = max(1, min(workers, len(dzs)))
+    print(f"Navegadores en paralelo: {workers}")
+    print("=" * 60)
+    lotes = [dzs[i::workers] for i in range(workers)]
 
     reportes_descargados = []
     reportes_fallidos = []
 
-    try:
-        # Navegar a SISMOP - Página principal
-        print(f"[INFO] Navegando a {SISMOP_URL}...")
-        driver.get(SISMOP_URL)
-        time.sleep(3)
-
-        # Seleccionar tipo de red en la página inicial
-        boton_tipo = "Automáticas" if tipo_red == "automaticas" else "Convencionales"
-        print(f"[INFO] Seleccionando '{boton_tipo}'...")
-        hacer_click_boton(driver, boton_texto=boton_tipo)
-        time.sleep(3)  # Esperar a que cargue la página
-
-        # Procesar cada DZ
-        for dz_num in dzs:
-            print(f"\n[DZ {dz_num}] Procesando Dirección Zonal {dz_num}...")
-
-            try:
-                # 1. Seleccionar la DZ
-                print(f"  [1/5] Seleccionando DZ {dz_num}...")
-                seleccionar_dropdown_dash(driver, ID_DROPDOWN_DZ, f"DZ {dz_num}")
-                time.sleep(1)  # Esperar a que se actualice el dropdown de estaciones
-
-                # 2. Seleccionar una estación (la primera disponible)
-                # Esto es necesario para que carguen los datos
-                print(f"  [2/5] Seleccionando primera estación disponible...")
-                seleccionar_primera_opcion_dropdown(driver, ID_DROPDOWN_ESTACION)
-
-                # 3. Seleccionar fecha de inicio (usando placeholder "Start Date")
-                print(f"  [3/5] Configurando fecha inicio: {fecha_inicio.strftime('%d/%m/%Y')}...")
-                seleccionar_fecha_dash(driver, "Start Date", fecha_inicio)
-
-                # 4. Seleccionar fecha fin (usando placeholder "End Date")
-                print(f"  [4/5] Configurando fecha fin: {fecha_fin_sismop.strftime('%d/%m/%Y')}...")
-                seleccionar_fecha_dash(driver, "End Date", fecha_fin_sismop)
-
-                # Los datos cargan automáticamente al seleccionar las fechas
-                # Esperar carga de datos
-                print("  [    ] Esperando carga de datos...")
-                if not esperar_carga_datos(driver):
-                    print(f"  [ERROR] No se pudieron cargar los datos para DZ {dz_num}")
-                    reportes_fallidos.append(dz_num)
-                    continue
-
-                # 5. Generar y descargar reporte
-                print("  [5/5] Generando reporte PDF...")
-
-                # Obtener lista de PDFs ANTES de descargar para detectar el nuevo
-                pdfs_antes = obtener_pdfs_existentes(directorio_salida)
-
-                hacer_click_boton(driver, boton_id=ID_BOTON_REPORTE)
-
-                # Esperar descarga (comparando con PDFs anteriores)
-                print(f"  [    ] Esperando descarga del PDF...")
-                if esperar_descarga_completa(directorio_salida, TIMEOUT_GENERACION_REPORTE, driver, dias, pdfs_antes):
-                    print(f"  [OK] Reporte DZ {dz_num} descargado correctamente")
-                    reportes_descargados.append(dz_num)
-
-                    # Renombrar el archivo descargado con formato estándar
-                    renombrar_ultimo_pdf(directorio_salida, dz_num, fecha_inicio, fecha_fin_sismop - timedelta(days=1))
-                else:
-                    print(f"  [ERROR] Timeout en descarga para DZ {dz_num}")
-                    reportes_fallidos.append(dz_num)
+    # Selenium pasa casi todo el tiempo esperando al navegador: basta con hilos
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futuros = [
+            ex.submit(descargar_lote_dzs, lote, num_navegador, fecha_inicio, fecha_fin_sismop,
+                      dias, directorio_salida, tipo_red, headless, modo_sesion)
+            for num_navegador, lote in enumerate(lotes, 1)
+        ]
+        for futuro in futuros:
+            descargados, fallidos = futuro.result()
+            reportes_descargados.extend(descargados)
+            reportes_fallidos.extend(fallidos)
 
-            except Exception as e:
-                print(f"  [ERROR] Error procesando DZ {dz_num}: {str(e)}")
-                reportes_fallidos.append(dz_num)
-                continue
-
-    finally:
-        # Cerrar navegador
-        print("\n[INFO] Cerrando navegador...")
-        driver.quit()
+    # Mantener el orden de las DZs solicitadas
+    reportes_descargados.sort(key=dzs.index)
+    reportes_fallidos.sort(key=dzs.index)
 
     # Resumen final
     print("\n" + "=" * 60)
@@ -671,7 +1154,8 @@ def descargar_reportes_dz(
     return reportes_descargados, reportes_fallidos
 
 
-def renombrar_ultimo_pdf(directorio: Path, dz_num: int, fecha_inicio: datetime, fecha_fin: datetime):
+def renombrar_ultimo_pdf(directorio: Path, dz_num: int, fecha_inicio: datetime, fecha_fin: datetime,
+                         directorio_destino: Path = None):
     """
     Renombra el último PDF descargado con un formato estándar.
 
@@ -682,13 +1166,14 @@ def renombrar_ultimo_pdf(directorio: Path, dz_num: int, fecha_inicio: datetime,
         dz_num: Número de la DZ
         fecha_inicio: Fecha de inicio del período
         fecha_fin: Fecha fin del período
+        directorio_destino: Directorio donde dejar el PDF renombrado (por defecto: directorio)
     """
     # Encontrar el PDF más reciente
-    pdfs = list(directorio.glob("*.pdf"))
+    pdfs = listar_archivos(directorio, ".pdf")
     if not pdfs:
         return
 
-    pdf_reciente = max(pdfs, key=lambda p: p.stat().st_mtime)
+    pdf_reciente = Path(max(pdfs, key=lambda e: e.stat().st_mtime).path)
 
     # Generar nuevo nombre
     fecha_ini_str = fecha_inicio.strftime("%d%m")
@@ -696,8 +1181,10 @@ def renombrar_ultimo_pdf(directorio: Path, dz_num: int, fecha_inicio: datetime,
     nuevo_nombre = f"Reporte_DZ_{dz_num}_{fecha_ini_str}_{fecha_fin_str}.pdf"
 
     # Renombrar si el nombre es diferente
-    nuevo_path = directorio / nuevo_nombre
-    if pdf_reciente.name != nuevo_nombre:
+    if directorio_destino is None:
+        directorio_destino = directorio
+    nuevo_path = directorio_destino / nuevo_nombre
+    if pdf_reciente != nuevo_path:
         # Si ya existe un archivo con ese nombre, eliminarlo
         if nuevo_path.exists():
             nuevo_path.unlink()
@@ -721,6 +1208,10 @@ Ejemplos de uso:
   python descargar_reportes.py --dias 30               # Período de 30 días
   python descargar_reportes.py --fecha-fin 2025-12-12  # Fecha específica
   python descargar_reportes.py --tipo convencionales   # Red convencional
+  python descargar_reportes.py --workers 1             # Un solo navegador (secuencial)
+  python descargar_reportes.py --ver-navegador         # Mostrar la ventana de Chrome
+  python descargar_reportes.py --mantener-navegador    # Dejar Chrome abierto al terminar
+  python descargar_reportes.py --reusar-navegador      # Reutilizar ese Chrome (sin arranque)
         """
     )
 
@@ -751,6 +1242,34 @@ Ejemplos de uso:
         help="Directorio de salida para los PDFs. Por defecto: ./input_pdfs"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS_DESCARGA,
+        help=f"Número de navegadores descargando en paralelo. Por defecto: {WORKERS_DESCARGA}"
+    )
+
+    parser.add_argument(
+        "--ver-navegador",
+        action="store_true",
+        help="Mostrar la ventana de Chrome (por defecto se ejecuta en modo headless)"
+    )
+
+    sesion = parser.add_mutually_exclusive_group()
+    sesion.add_argument(
+        "--mantener-navegador",
+        action="store_true",
+        help=f"Dejar Chrome abierto con depuración remota (puerto {PUERTO_DEPURACION_BASE} en adelante) "
+             "para reutilizarlo en la siguiente ejecución. Esos Chrome (headless salvo --ver-navegador) "
+             "siguen corriendo hasta cerrarlos a mano: ver README, 'Cerrar los navegadores mantenidos'"
+    )
+    sesion.add_argument(
+        "--reusar-navegador",
+        action="store_true",
+        help="Conectarse a los Chrome dejados abiertos con --mantener-navegador (usar el mismo --workers; "
+             "conservan el modo headless o con ventana con que se iniciaron)"
+    )
+
     parser.add_argument(
         "--tipo",
         type=str,
@@ -761,6 +1280,11 @@ Ejemplos de uso:
 
     args = parser.parse_args()
 
+    # Al reusar, Chrome ya está corriendo: no se puede cambiar a modo con ventana
+    if args.reusar_navegador and args.ver_navegador:
+        parser.error("--ver-navegador no aplica con --reusar-navegador: el navegador conserva el modo "
+                     "con que se inició (usar --ver-navegador junto con --mantener-navegador)")
+
     # Procesar fecha fin
     fecha_fin = None
     if args.fecha_fin:
@@ -782,6 +1306,13 @@ Ejemplos de uso:
                 print(f"Error: DZ {dz} fuera de rango. Debe ser entre 1 y {TOTAL_DZS}")
                 sys.exit(1)
 
+    # Modo de sesión del navegador
+    modo_sesion = "nueva"
+    if args.mantener_navegador:
+        modo_sesion = "mantener"
+    elif args.reusar_navegador:
+        modo_sesion = "reusar"
+
     # Ejecutar descarga
     try:
         descargados, fallidos = descargar_reportes_dz(
@@ -789,7 +1320,10 @@ Ejemplos de uso:
             fecha_fin=fecha_fin,
             dias=args.dias,
             directorio_salida=directorio_salida,
-            tipo_red=args.tipo
+            tipo_red=args.tipo,
+            workers=args.workers,
+            headless=not args.ver_navegador,
+            modo_sesion=modo_sesion
         )
 
         # Código de salida basado en resultados
@@ -492,12 +492,14 @@ class DataProcessor:
         ]
 
         # Trabajar solo con disponibilidades <= 100%
-        df_sens = df_sensores[df_sensores['disponibilidad_norm'] <= 100.0].copy()
-        df_var  = df_variables[df_variables['disponibilidad_norm'] <= 100.0].copy()
+        # Solo lectura de aquí en adelante: el filtrado ya produce frames nuevos, sin .copy()
+        df_sens = df_sensores[df_sensores['disponibilidad_norm'] <= 100.0]
+        df_var  = df_variables[df_variables['disponibilidad_norm'] <= 100.0]
 
         # Tabla base de estaciones (disponibilidad normalizada)
-        est_base = df_estaciones[['DZ', 'Estacion', 'disponibilidad_norm']].copy()
-        est_base = est_base.rename(columns={'disponibilidad_norm': 'disponibilidad_estacion'})
+        est_base = df_estaciones[['DZ', 'Estacion', 'disponibilidad_norm']].rename(
+            columns={'disponibilidad_norm': 'disponibilidad_estacion'}
+        )
 
         resultados = []
 
@@ -506,7 +508,7 @@ class DataProcessor:
 
         sens_criticos = df_sens[df_sens['disponibilidad_norm'] < umbral][
             ['DZ', 'Estacion', 'Sensor', 'disponibilidad_norm']
-        ].copy()
+        ]
 
         if len(sens_criticos) > 0:
             m = est_ok.merge(sens_criticos, on=['DZ', 'Estacion'], how='inner')
@@ -524,14 +526,14 @@ class DataProcessor:
         # Base: sensores con disponibilidad >= umbral
         sens_ok = df_sens[df_sens['disponibilidad_norm'] >= umbral][
             ['DZ', 'Estacion', 'Sensor', 'disponibilidad_norm']
-        ].copy()
+        ]
         sens_ok = sens_ok.rename(columns={'disponibilidad_norm': 'disponibilidad_sensor'})
 
         # Variables con 'Variable' como columna de nombre individual
         col_var_nombre = 'Variable' if 'Variable' in df_var.columns else 'Sensor'
         var_criticas = df_var[df_var['disponibilidad_norm'] < umbral][
             ['DZ', 'Estacion', 'Sensor', col_var_nombre, 'Frecuencia', 'disponibilidad_norm']
-        ].drop_duplicates().copy()
+        ].drop_duplicates()
 
         if len(var_criticas) > 0 and len(sens_ok) > 0:
             m2 = sens_ok.merge(var_criticas, on=['DZ', 'Estacion', 'Sensor'], how='inner')
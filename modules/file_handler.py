@@ -5,15 +5,20 @@ Maneja la lectura de reportes y extracción de metadata
 """
 
 import pandas as pd
+import io
 import os
 import re
 import streamlit as st
 from datetime import datetime
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, FrozenSet
 
 from config import config, messages
 
 
+# Patrón de fechas en el nombre del reporte: 4 dígitos_4 dígitos.xlsx (DDMM_DDMM)
+_PATRON_FECHAS_ARCHIVO = re.compile(r'(\d{4})_(\d{4})\.xlsx?')
+
+
 # ============================================================================
 # EXCEPCIONES PERSONALIZADAS
 # ============================================================================
@@ -53,9 +58,7 @@ class ExcelFileHandler:
             ("08/10/2025", "19/10/2025", 2025)
         """
         try:
-            # Patrón: 4 dígitos_4 dígitos.xlsx
-            patron = r'(\d{4})_(\d{4})\.xlsx?'
-            match = re.search(patron, nombre_archivo)
+            match = _PATRON_FECHAS_ARCHIVO.search(nombre_archivo)
             
             if not match:
                 return None, None, None
@@ -116,27 +119,27 @@ class ExcelFileHandler:
         return df
 
     @staticmethod
-    def validar_columnas(df: pd.DataFrame, columnas_requeridas: List[str], nombre_hoja: str) -> None:
+    def validar_columnas(df: pd.DataFrame, columnas_requeridas: FrozenSet[str], nombre_hoja: str) -> None:
         """
         Valida que el DataFrame contenga todas las columnas requeridas (case-insensitive)
 
         Args:
             df: DataFrame a validar
-            columnas_requeridas: Lista de nombres de columnas que deben existir
+            columnas_requeridas: Conjunto de nombres de columnas que deben existir
             nombre_hoja: Nombre de la hoja (para mensaje de error)
 
         Raises:
             FileValidationError: Si faltan columnas requeridas
         """
         # Comparación case-insensitive
-        columnas_df_lower = {col.lower(): col for col in df.columns}
+        columnas_df_lower = {col.lower() for col in df.columns}
         columnas_req_lower = {col.lower(): col for col in columnas_requeridas}
 
-        columnas_faltantes = set(columnas_req_lower.keys()) - set(columnas_df_lower.keys())
+        columnas_faltantes = columnas_req_lower.keys() - columnas_df_lower
 
         if columnas_faltantes:
-            # Mostrar nombres originales requeridos
-            nombres_faltantes = [columnas_req_lower[col] for col in columnas_faltantes]
+            # Mostrar nombres originales requeridos (orden estable para el mensaje)
+            nombres_faltantes = sorted(columnas_req_lower[col] for col in columnas_faltantes)
             error_msg = (
                 f"Hoja '{nombre_hoja}' - Columnas faltantes: {', '.join(nombres_faltantes)}\n"
                 f"Columnas encontradas: {', '.join(df.columns)}"
@@ -285,9 +288,11 @@ class ExcelFileHandler:
         Returns:
             Bytes del CSV codificado en UTF-8 con BOM (para Excel)
         """
-        # Usar utf-8-sig para que Excel abra correctamente con tildes
-        csv_data = df.to_csv(index=False).encode('utf-8-sig')
-        return csv_data
+        # Usar utf-8-sig para que Excel abra correctamente con tildes.
+        # Se escribe directo a un buffer binario: evita el str intermedio y su copia al codificar
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, encoding='utf-8-sig')
+        return buffer.getvalue()
     
     @staticmethod
     def crear_nombre_descarga(prefijo: str, extension: str = "csv") -> str:
@@ -9,7 +9,7 @@ import pandas as pd
 from datetime import datetime
 from typing import Dict, Optional
 
-from config import config, messages, charts
+from config import config, messages, charts, styles, Priority
 from modules.chart_builder import (
     ChartBuilder,
     preparar_stats_tipo_sensor,
@@ -20,6 +20,21 @@ from modules.data_processor import DataProcessor
 from modules.file_handler import ExcelFileHandler
 
 
+# ============================================================================
+# TARJETAS DE PRIORIDAD
+# ============================================================================
+
+# (prioridad, título, descripción, detalle) de cada tarjeta, en orden de columna
+_TARJETAS_PRIORIDAD = (
+    (Priority.ALTA, "🔴 PRIORIDAD ALTA", "Requieren atención inmediata",
+     "Nuevas (≤30 días) o críticas sin resolver"),
+    (Priority.MEDIA, "🟡 PRIORIDAD MEDIA", "En monitoreo o recurrentes",
+     "Requieren seguimiento técnico continuo"),
+    (Priority.BAJA, "⚪ INFORMATIVO", "Paralizadas (≥90 días)",
+     "Disponibilidad 0% - Candidatas a clausura si >2 años"),
+)
+
+
 # ============================================================================
 # CLASE PRINCIPAL
 # ============================================================================
@@ -47,40 +62,18 @@ class UIComponents:
 
         prioridades = df_estaciones['prioridad'].value_counts()
 
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            alta_count = prioridades.get('ALTA', 0)
-            st.markdown(f"""
-            <div class="prioridad-alta">
-                <p class="prioridad-title">🔴 PRIORIDAD ALTA</p>
-                <p class="prioridad-number">{alta_count}</p>
-                <p class="prioridad-desc">Requieren atención inmediata</p>
-                <p class="prioridad-detail">Nuevas (≤30 días) o críticas sin resolver</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            media_count = prioridades.get('MEDIA', 0)
-            st.markdown(f"""
-            <div class="prioridad-media">
-                <p class="prioridad-title">🟡 PRIORIDAD MEDIA</p>
-                <p class="prioridad-number">{media_count}</p>
-                <p class="prioridad-desc">En monitoreo o recurrentes</p>
-                <p class="prioridad-detail">Requieren seguimiento técnico continuo</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            baja_count = prioridades.get('BAJA', 0)
-            st.markdown(f"""
-            <div class="prioridad-baja">
-                <p class="prioridad-title">⚪ INFORMATIVO</p>
-                <p class="prioridad-number">{baja_count}</p>
-                <p class="prioridad-desc">Paralizadas (≥90 días)</p>
-                <p class="prioridad-detail">Disponibilidad 0% - Candidatas a clausura si >2 años</p>
-            </div>
-            """, unsafe_allow_html=True)
+        for col, (prioridad, titulo, desc, detalle) in zip(st.columns(3), _TARJETAS_PRIORIDAD):
+            with col:
+                st.markdown(f"""
+                <div class="{styles.PRIORITY_CLASS[prioridad]}">
+                    <p class="prioridad-title">{titulo}</p>
+                    <p class="prioridad-number">{prioridades.get(prioridad, 0)}</p>
+                    <p class="prioridad-desc">{desc}</p>
+                    <p class="prioridad-detail">{detalle}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        alta_count = prioridades.get(Priority.ALTA, 0)
 
         # Mostrar tabla de prioridad alta si hay
         if alta_count > 0: